@@ -1,24 +1,18 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import csv
 import ast
 import os
+import re
 import sys
 import threading
 import time
 import platform
 import json
-import pygame
-import cProfile
-import pstats
+import statistics
+from collections import deque
 
-# For Windows Registry autoload (only used on Windows)
-if platform.system().lower().startswith('win'):
-    import winreg
-
-# For system tray integration
-import pystray
-from PIL import Image, ImageDraw
+# winreg (autoload), pystray/PIL (system tray) and cProfile/pstats (PROFILING_ENABLED) are
+# imported on first use: many sessions never touch those features, so they should not slow down cold start.
 
 # HID packages
 # import hid # No longer directly needed here, utils_hid encapsulates it
@@ -29,17 +23,54 @@ import utils_hid # Optimized HID utility module
 # --------------------------
 CONFIG_FILE = "driftguard_config.json"
 DRAW_INTERVAL_MS = 16  # ~60 FPS (was 32)
+DRAW_IDLE_INTERVAL_MS = 200 # Redraw rate while no joystick is connected (static text only)
+AUTOLOAD_CONNECT_TIMEOUT_S = 5.0 # How long the startup calibration autoload waits for a controller to connect
+SETTINGS_SAVE_DELAY_MS = 250 # Debounce window for coalescing settings writes
+LOG_QUEUE_MAX_LINES = 5000 # Log lines kept while waiting for the terminal widget to catch up
 PROFILING_ENABLED = False # Set to True to enable cProfile on launch
+PROFILE_OUTPUT_FILE = "profile_output.prof" # Where the PROFILING_ENABLED run dumps its pstats data
+PRECISE_POLL_TIMING = False # Spin out the last POLL_SPIN_MARGIN_S of each poll period; off by default, the 1 ms Windows timer (joystick_thread_main) makes wait() accurate enough
+POLL_SPIN_MARGIN_S = 0.002 # Time before a poll deadline where time.sleep() (OS timer granularity) hands over to spinning
+
+FEATURE_RESPONSE_TIMEOUT_S = 0.05 # Longest wait for the controller's 0x81 answer to a 0x80 request
+FEATURE_RESPONSE_POLL_S = 0.002 # Re-read interval while waiting for that answer
+INPUT_REPORT_TIMEOUT_S = 1.0 # USB / BT extended reports stream constantly; this much silence after one means it's gone
 
-PS_SUPPORTED_DEVICES = {
-    ("054C", "0DF2"): "Sony DualSense Edge",
+PS_SUPPORTED_DEVICES = { # (vendor_id, product_id) as reported by hid.enumerate()
+    (0x054C, 0x0DF2): "Sony DualSense Edge",
     # Add other supported VIDs/PIDs here if necessary
 }
 
+# DualSense input report IDs (see parse_dualsense_axes)
+DS_INPUT_REPORT_USB = 0x01 # Also used by the short Bluetooth report
+DS_INPUT_REPORT_BT = 0x31
+DS_BT_SIMPLE_REPORT_LEN = 10
+
+# DualSense Edge feature report payloads, sent to report 0x80 (answers are read from 0x81).
+# Kept as bytes, which utils_hid.hid_set_feature_report() sends without any conversion.
+DS_REQUEST_SERIAL = b"\x01\x13\x01"
+DS_REQUEST_CALIBRATION = b"\x0c\x04\x00"
+DS_WRITE_CALIBRATION_PREFIX = b"\x0c\x01" # Followed by the DS_CALIBRATION_LEN calibration bytes
+DS_CALIBRATION_LEN = 28 # Payload size read by get_calibration_data_from_ds() (bytes 4-31 of report 0x81)
+
+# get_controller_serial() status strings that must not end up in a default filename
+SERIAL_ERROR_STRINGS = frozenset((
+    "Controller not connected.", "Serial not found (no data).", "Serial not found (wrong report).",
+    "Serial not found (empty).", "Serial not found (decode error).", "Serial not found (no segment).",
+    "Serial request failed.",
+))
+FILENAME_UNSAFE_RE = re.compile(r"\W") # Anything but letters, digits and "_" becomes "_" in default filenames
+
 GAMEPAD_USAGE_PAGE = 0x01  # Generic Desktop Controls
 GAMEPAD_USAGE = 0x05       # Gamepad
 JOYSTICK_USAGE = 0x04      # Joystick
 
+# hid.enumerate() "bus_type" values (hidapi >= 0.13, missing on older builds)
+HID_BUS_USB = 1
+HID_BUS_BLUETOOTH = 2
+# ps_controller_conn_type -> over_bluetooth for parse_dualsense_axes(); "(Unknown)"/"(Error)" map to None
+CONNECTION_TYPE_IS_BLUETOOTH = {"(BT)": True, "(USB)": False}
+
 # Color / UI config (Dark Mode)
 COLOR_BG_DARK = "#2B2B2B"
 COLOR_FRAME_DARK = "#3B3B3B"
@@ -52,24 +83,36 @@ COLOR_RIGHT_DOT = "#FF5555"
 COLOR_BUTTON_BG = "#444444"
 COLOR_BUTTON_ACTIVE = "#666666"
 COLOR_CHECK_SELECT = "#444444"
-
-# --------------------------
-# Pygame Joystick Setup
-# --------------------------
-pygame.init()
-pygame.joystick.init()
+COLOR_TERMINAL_BG = "#1E1E1E"
+
+# Static text of the read-only instructions panel
+INSTRUCTIONS_TEXT = (
+    "Instructions:\n"
+    "Ensure your controller (DualSense/Edge) is calibrated via external tools first if needed (e.g., Steam Big Picture, DS4Windows, or online gamepad testers for basic checks).\n\n"
+    "1. 'Save Current Calibration to CSV': Reads the current stick calibration values from the connected USB controller and saves them to a CSV file.\n"
+    "2. 'Load Calibration from CSV': Loads calibration data from a previously saved CSV file and writes it to the connected USB controller.\n"
+    "3. Center panel: Visualizes analog stick and trigger movements.\n"
+    "4. Right panel: Logs application activity and errors.\n"
+    "5. Compatibility: Sony DualSense Edge controllers. Writing calibration requires USB; reading and stick visualization also work over Bluetooth.\n"
+    "6. Settings: Configure 'Autoload on Windows Start', 'Start Minimized', and 'Load Calibration on Startup' using the checkboxes and file path below.\n"
+    "7. Startup File: Specify the CSV file to automatically load and apply if 'Load Calibration on Startup' is checked."
+)
 
 # --------------------------
 # Global Variables
 # --------------------------
 tray_icon = None
-joystick = None # Pygame joystick object
+tray_thread = None # Runs run_tray_icon(); alive exactly while the tray icon is shown
+_tray_image = None # PIL image built by create_tray_image(), reused every time the app goes to the tray
+joystick_name = "" # Product name of the connected controller
+# Latest (lx, ly, rx, ry, lt, rt) sample. Single producer (joystick thread), single consumer (Tk):
+# the worker only ever rebinds a new immutable tuple, so the GUI reads the newest sample without a lock or queue.
 joystick_axes = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
-joystick_vid_pid = ("", "") # VID/PID of the connected controller
+joystick_vid_pid = (0, 0) # (vendor_id, product_id) ints of the connected controller
 ps_controller_conn_type = "" # (BT), (USB), (Unknown)
 is_joystick_connected = False # Overall connection status
 joystick_thread = None
-joystick_thread_running = False
+joystick_stop_event = threading.Event() # Set to stop joystick_background_loop; also wakes its sleeps immediately
 root = None
 terminal_text = None
 analog_canvas = None
@@ -80,43 +123,90 @@ autoload_calibration_var = None
 startup_calibration_file_path_var = None
 active_dev_path = None # HID device path for utils_hid
 device_detect_fail_count = 0 # Counter for detection failures
+_last_controller_status_text = None # Text currently shown by controller_status_label
+_canvas_items = {} # Persistent analog canvas item IDs, see create_analog_canvas_items()
+_analog_canvas_connected_view = None # View currently shown by set_analog_canvas_view()
+_analog_geometry = {} # Canvas-size dependent layout, refreshed by on_analog_canvas_configure()
+_calibration_file_cache = {} # {file_path: ((mtime_ns, size), parsed)}, see parse_calibration_file()
+_last_drawn_axes = None # Pixel-quantized axes the dots/trigger fills currently show, None forces a redraw
+_draw_net_delays = deque(maxlen=60) # Recent ui_tick costs (seconds)
+_tick_lateness = deque(maxlen=60) # How late recent paced ui_tick timers fired (seconds)
+_expected_tick_time = None # perf_counter() time the next paced ui_tick was requested for
+controller_status_changed = threading.Event() # Set by the joystick thread on connect/disconnect, consumed by ui_tick
+controller_status_changed.set() # Show the initial "None" status on the first tick
+joystick_connected_event = threading.Event() # Mirrors is_joystick_connected so waiters wake on connect instead of polling
 
 # Logging specific globals
 early_log_messages = [] # For messages before GUI is ready
 gui_ready_and_valid = False # Flag to indicate GUI state for logging
+_log_queue = deque(maxlen=LOG_QUEUE_MAX_LINES) # Terminal lines waiting for flush_log_queue(), oldest dropped first
+_log_timestamp = [None, ""] # [epoch second, "%H:%M:%S"] so strftime runs at most once per second
+_pending_tk_calls = deque() # Callables queued by worker threads, run on the Tk thread by ui_tick
+
+# Settings persistence
+_settings_save_after_id = None # Pending debounced save_settings() call
+_last_saved_settings = None # Settings dict last written to (or read from) CONFIG_FILE
 
 # --------------------------
 # Utility & Config
 # --------------------------
+# PyInstaller's unpack dir when frozen, otherwise the working directory; resolved once at import
+_RESOURCE_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
 def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_RESOURCE_BASE_PATH, relative_path)
+
+ICON_PATH = resource_path("data/icon_drift_guard_main.ico") # Window and tray icon
 
 def log_to_terminal(message):
+    """
+    Safe to call from any thread: it never touches Tk. Lines are queued and written to the
+    terminal widget by flush_log_queue(), which ui_tick runs on the Tk thread.
+    """
     global gui_ready_and_valid # Indicate we are using the global flag
-    current_time = time.strftime("%H:%M:%S", time.localtime())
-    full_message = f"[{current_time}] {message}"
+    now = int(time.time())
+    if now != _log_timestamp[0]:
+        _log_timestamp[:] = now, time.strftime("%H:%M:%S", time.localtime(now))
+    full_message = f"[{_log_timestamp[1]}] {message}"
 
-    if gui_ready_and_valid and terminal_text and terminal_text.winfo_exists():
-        # If there are early messages, print them first
+    if gui_ready_and_valid and terminal_text and root:
+        # If there are early messages, queue them first
         if early_log_messages:
-            for msg in early_log_messages:
-                terminal_text.insert(tk.END, msg + "\n")
+            _log_queue.extend(early_log_messages)
             early_log_messages.clear() # Clear the queue
-        
-        terminal_text.insert(tk.END, full_message + "\n")
-        terminal_text.see(tk.END)
+        _log_queue.append(full_message)
     elif not gui_ready_and_valid: # GUI not initialized yet
         early_log_messages.append(full_message)
         print("[Early Log] " + full_message) # Also print to console as fallback
     else: # GUI was ready but now is not (e.g., during shutdown)
         print("[Shutdown Log] " + full_message)
 
+def flush_log_queue():
+    """Writes every queued log line to the terminal widget in one insert + see. Tk thread only."""
+    batch = []
+    while _log_queue:
+        batch.append(_log_queue.popleft())
+    if not batch:
+        return
+    if terminal_text and terminal_text.winfo_exists():
+        terminal_text.insert(tk.END, "\n".join(batch) + "\n")
+        terminal_text.see(tk.END)
+    else: # Widget is gone (e.g., during shutdown)
+        for msg in batch:
+            print("[Shutdown Log] " + msg)
+
+
+def collect_settings():
+    """Returns the persisted settings as a plain dict built from the Tk variables."""
+    return {
+        "autoload": autoload_checkbox_var.get(),
+        "start_minimized": start_minimized_var.get(),
+        "autoload_calibration": autoload_calibration_var.get(),
+        "startup_calibration_file": startup_calibration_file_path_var.get(),
+    }
 
 def load_settings():
+    global _last_saved_settings
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, 'r') as f:
@@ -126,6 +216,7 @@ def load_settings():
             autoload_calibration_var.set(data.get("autoload_calibration", False))
             default_path = "startup_calibration.csv"
             startup_calibration_file_path_var.set(data.get("startup_calibration_file", default_path))
+            _last_saved_settings = collect_settings() # What is on disk now, no need to write it back
             log_to_terminal("Settings loaded successfully.")
         except Exception as e:
             log_to_terminal(f"Failed to load config: {e}")
@@ -134,25 +225,37 @@ def load_settings():
         log_to_terminal("Config file not found, using default startup calibration path.")
 
 
-def threaded_load_settings():
-    threading.Thread(target=load_settings, daemon=True).start()
-
 def save_settings():
-    data = {
-        "autoload": autoload_checkbox_var.get(),
-        "start_minimized": start_minimized_var.get(),
-        "autoload_calibration": autoload_calibration_var.get(),
-        "startup_calibration_file": startup_calibration_file_path_var.get(),
-    }
+    global _settings_save_after_id, _last_saved_settings
+    _settings_save_after_id = None
+    data = collect_settings()
+    if data == _last_saved_settings:
+        return # Nothing changed since the last write
+    if data["autoload"] != (_last_saved_settings or {}).get("autoload", False):
+        set_autoload(data["autoload"]) # Registry write is coalesced with the settings write
+    tmp_path = CONFIG_FILE + ".tmp"
     try:
-        with open(CONFIG_FILE, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump(data, f, indent=4)
+        os.replace(tmp_path, CONFIG_FILE) # Atomic, never leaves a half-written config behind
+        _last_saved_settings = data
         log_to_terminal("Settings saved.")
     except Exception as e:
         log_to_terminal(f"Failed to save config: {e}")
 
-def threaded_save_settings():
-    threading.Thread(target=save_settings, daemon=True).start()
+def schedule_save_settings():
+    """
+    Debounces settings writes: a burst of checkbox toggles or keystrokes in the startup
+    path entry results in a single save_settings() SETTINGS_SAVE_DELAY_MS after the last change
+    (including the autoload registry value, which is only touched when it actually flipped).
+    """
+    global _settings_save_after_id
+    if not root:
+        save_settings()
+        return
+    if _settings_save_after_id:
+        root.after_cancel(_settings_save_after_id)
+    _settings_save_after_id = root.after(SETTINGS_SAVE_DELAY_MS, save_settings)
 
 def set_autoload(enabled):
     if not platform.system().lower().startswith('win'):
@@ -167,6 +270,7 @@ def set_autoload(enabled):
         app_path = os.path.abspath(sys.argv[0])
 
     try:
+        import winreg # Windows-only, checked above
         key = winreg.HKEY_CURRENT_USER
         subkey = r"Software\Microsoft\Windows\CurrentVersion\Run"
         with winreg.OpenKey(key, subkey, 0, winreg.KEY_ALL_ACCESS) as regkey: # KEY_ALL_ACCESS
@@ -186,42 +290,51 @@ def set_autoload(enabled):
 
 
 def on_autoload_checkbox_change():
-    set_autoload(autoload_checkbox_var.get())
-    threaded_save_settings()
+    schedule_save_settings() # save_settings() updates the registry Run key
 
 def on_start_minimized_checkbox_change():
-    threaded_save_settings()
+    schedule_save_settings()
 
 def on_autoload_calibration_checkbox_change():
-    threaded_save_settings()
+    schedule_save_settings()
 
 def on_startup_file_change(*args):
-    threaded_save_settings()
+    schedule_save_settings()
 
 def on_browse_startup_file():
     file_path = filedialog.askopenfilename(
         title="Select Startup Calibration CSV",
         filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
     )
-    if file_path:
+    # Re-picking the same file would only fire the write trace for nothing
+    if file_path and file_path != startup_calibration_file_path_var.get():
         startup_calibration_file_path_var.set(file_path)
-        # threaded_save_settings() # This will be called by trace on startup_calibration_file_path_var
+        # schedule_save_settings() # This will be called by trace on startup_calibration_file_path_var
 
 def create_tray_image():
-    icon_path = resource_path("data/icon_drift_guard_main.ico")
+    """Returns the tray icon image, loading (and decoding) it only the first time the app goes to the tray."""
+    global _tray_image
+    if _tray_image is None:
+        _tray_image = load_tray_image()
+    return _tray_image
+
+def load_tray_image():
+    from PIL import Image, ImageDraw # Deferred: only needed once the app goes to the tray
     try:
-        return Image.open(icon_path)
+        image = Image.open(ICON_PATH)
+        image.load() # Decode now, on the tray thread, instead of lazily inside pystray
+        return image
     except Exception as e:
         log_to_terminal(f"Failed to load icon: {e}. Using fallback.")
-        fallback_img = Image.new('RGB', (64, 64), color="#444444")
+        fallback_img = Image.new('RGB', (64, 64), color=COLOR_BUTTON_BG)
         # Simple text drawing, consider using a specific font for better Pillow text rendering
         d = ImageDraw.Draw(fallback_img)
         try:
             from PIL import ImageFont
             font = ImageFont.truetype("arial.ttf", 30) # Example, ensure font is available
-            d.text((10, 15), "DG", fill="white", font=font)
+            d.text((10, 15), "DG", fill=COLOR_TEXT_LIGHT, font=font)
         except ImportError: # Fallback if specific font fails
-            d.text((10, 20), "DG", fill="white") # Default font, size might not be controllable like this
+            d.text((10, 20), "DG", fill=COLOR_TEXT_LIGHT) # Default font, size might not be controllable like this
         return fallback_img
 
 def on_tray_show(icon, item):
@@ -238,6 +351,7 @@ def on_tray_exit(icon, item):
 
 def run_tray_icon():
     global tray_icon
+    import pystray # Deferred: only needed once the app goes to the tray
     image = create_tray_image()
     menu = pystray.Menu(
         pystray.MenuItem("Show", on_tray_show, default=True), # Make "Show" default on double click
@@ -251,14 +365,15 @@ def run_tray_icon():
 
 
 def hide_window_to_tray():
+    global tray_thread
     if root:
       root.withdraw()
-    # Start tray icon in a separate thread only if not already running or visible
-    # This logic helps prevent multiple tray icons if hide_window_to_tray is called multiple times
-    # A more robust check might involve checking if the tray_icon.run() thread is alive.
-    if not tray_icon or not tray_icon.HAS_NOTIFICATION: # HAS_NOTIFICATION is a simple proxy for "is it active"
+    # The icon (pystray import + PIL image load) is built on its own thread, so hiding never waits
+    # on it. tray_icon.run() returns once the icon is stopped, so a live thread means it's still shown.
+    if not (tray_thread and tray_thread.is_alive()):
         log_to_terminal("Hiding window to system tray.")
-        threading.Thread(target=run_tray_icon, daemon=True).start()
+        tray_thread = threading.Thread(target=run_tray_icon, daemon=True)
+        tray_thread.start()
     else:
         log_to_terminal("Window hidden, tray icon already active or being activated.")
 
@@ -275,16 +390,16 @@ def on_close_window(): # Renamed from on_close to avoid conflict
 
 
 def really_quit_app():
-    global joystick_thread_running, root, tray_icon, gui_ready_and_valid # Add gui_ready_and_valid
+    global root, tray_icon, gui_ready_and_valid # Add gui_ready_and_valid
 
     gui_ready_and_valid = False # GUI is being shut down, redirect logs to console
 
     log_to_terminal("Initiating application shutdown...")
 
-    joystick_thread_running = False
+    joystick_stop_event.set()
     if joystick_thread and joystick_thread.is_alive():
         log_to_terminal("Waiting for joystick thread to terminate...")
-        joystick_thread.join(timeout=1.0) # Wait for the thread to finish
+        joystick_thread.join(timeout=0.2) # The stop event interrupts its sleeps, so this is at most one poll
         if joystick_thread.is_alive():
             log_to_terminal("Joystick thread did not terminate in time.")
 
@@ -292,10 +407,6 @@ def really_quit_app():
     utils_hid.close_all_hid_devices()
     log_to_terminal("All HID devices closed.")
 
-    pygame.joystick.quit()
-    pygame.quit()
-    log_to_terminal("Pygame quit.")
-
     if tray_icon:
         log_to_terminal("Stopping tray icon...")
         try:
@@ -304,6 +415,10 @@ def really_quit_app():
             log_to_terminal(f"Error stopping tray icon: {e}")
         tray_icon = None # Clear the reference
     
+    if root and _settings_save_after_id: # Don't lose a change made within the debounce window
+        root.after_cancel(_settings_save_after_id)
+        save_settings()
+
     if root:
         log_to_terminal("Destroying Tkinter root window...")
         try:
@@ -325,41 +440,52 @@ def on_minimize_window(event): # Renamed from on_minimize
         hide_window_to_tray()
 
 def list_hid_gamepads(): # Renamed from list_connected_gamepads for clarity
-    """Lists HID gamepads that are also responsive."""
+    """
+    Lists the PS_SUPPORTED_DEVICES gamepads from one enumeration, with integer 'vid'/'pid'.
+    Devices are not opened/probed here: the
+    caller opens the one it wants and treats a failed open (or first read) as unresponsive.
+    """
     connected_devices = []
     try:
-        # hid.enumerate() can be slow if called very frequently.
-        # Consider rate-limiting its calls if performance issues arise here.
-        all_devices = utils_hid.hid.enumerate() # Access hid via utils_hid if you re-export
+        all_devices = utils_hid.hid.enumerate() # Only the once-per-hid_check_interval reconnect scan calls this
         for dev_info in all_devices:
             # Check for gamepad/joystick usage page and usage
             if dev_info["usage_page"] == GAMEPAD_USAGE_PAGE and \
                dev_info["usage"] in (JOYSTICK_USAGE, GAMEPAD_USAGE):
-                dev_path = dev_info["path"]
-                # Check responsiveness before adding
-                if utils_hid.is_device_responsive(dev_path, tries=1, delay=0.01): # Quick check
-                    vid_hex = f"{dev_info['vendor_id']:04X}"
-                    pid_hex = f"{dev_info['product_id']:04X}"
-                    product_name = dev_info.get('product_string', 'Unknown Device')
-                    connected_devices.append({'vid': vid_hex, 'pid': pid_hex, 'path': dev_path, 'name': product_name})
+                vid, pid = dev_info["vendor_id"], dev_info["product_id"]
+                if (vid, pid) not in PS_SUPPORTED_DEVICES: # Int tuple lookup, nothing formatted for other devices
+                    continue
+                product_name = dev_info.get('product_string', 'Unknown Device')
+                connected_devices.append({'vid': vid, 'pid': pid, 'path': dev_info["path"], 'name': product_name,
+                                          'bus_type': dev_info.get("bus_type")})
     except Exception as e:
         log_to_terminal(f"Error enumerating HID devices: {e}")
     return connected_devices
 
 def find_supported_sony_controller_hid(): # Renamed for clarity
     """Finds the first supported Sony controller via HID and returns its info."""
-    gamepads = list_hid_gamepads()
-    for dev in gamepads:
-        if (dev['vid'], dev['pid']) in PS_SUPPORTED_DEVICES:
-            log_to_terminal(f"Supported Sony HID device found: {dev['name']} ({dev['vid']}:{dev['pid']}) at {dev['path']}")
-            return dev # Returns dict: {'vid', 'pid', 'path', 'name'}
-    return None
-
-def check_sony_controller_connection_type(dev_path_to_check): # Renamed & takes path
+    gamepads = list_hid_gamepads() # Already filtered to PS_SUPPORTED_DEVICES
+    if not gamepads:
+        return None
+    dev = gamepads[0]
+    log_to_terminal(f"Supported Sony HID device found: {dev['name']} ({dev['vid']:04X}:{dev['pid']:04X}) at {dev['path']}")
+    return dev # Returns dict: {'vid', 'pid', 'path', 'name', 'bus_type'}
+
+def check_sony_controller_connection_type(dev_path_to_check, bus_type=None): # Renamed & takes path
+    """
+    Sets ps_controller_conn_type. The enumeration's bus_type answers this without any I/O;
+    the 0x83 feature report is only read when hidapi is too old to report it.
+    """
     global ps_controller_conn_type
     if not dev_path_to_check:
         ps_controller_conn_type = ""
         return
+    if bus_type == HID_BUS_USB:
+        ps_controller_conn_type = "(USB)"
+        return
+    if bus_type == HID_BUS_BLUETOOTH:
+        ps_controller_conn_type = "(BT)"
+        return
 
     # This assumes the device is already opened via open_hid_device if calls are frequent
     # The report 0x83 might be specific to DualSense Edge or certain firmware.
@@ -386,126 +512,191 @@ def check_sony_controller_connection_type(dev_path_to_check): # Renamed & takes
         ps_controller_conn_type = "(Error)" # If HID call fails
 
 
+def parse_dualsense_axes(report, over_bluetooth=None):
+    """
+    Decodes (lx, ly, rx, ry, lt, rt) from a DualSense / DualSense Edge input report,
+    scaled to what the analog canvas expects: sticks -1.0..1.0, triggers -1.0 (released)..1.0.
+    over_bluetooth is the transport detected at connect (None if unknown). It picks the layout
+    of report 0x01, because hidapi on Windows pads every input report to the collection's
+    report length, so a BT simple report cannot be recognized by its length there.
+    Returns None for reports that do not carry axis data.
+    """
+    if not report:
+        return None
+    report_id = report[0]
+    if report_id == DS_INPUT_REPORT_USB:
+        if over_bluetooth is None: # Transport unknown: the unpadded length is the best remaining guess
+            over_bluetooth = len(report) == DS_BT_SIMPLE_REPORT_LEN
+        if over_bluetooth and len(report) >= DS_BT_SIMPLE_REPORT_LEN:
+            stick_offset, trigger_offset = 1, 8 # BT simple report (before extended mode is enabled)
+        elif not over_bluetooth and len(report) > DS_BT_SIMPLE_REPORT_LEN:
+            stick_offset, trigger_offset = 1, 5 # USB full report
+        else:
+            return None
+    elif report_id == DS_INPUT_REPORT_BT and len(report) > 7:
+        stick_offset, trigger_offset = 2, 6 # BT extended report, one extra sequence byte
+    else:
+        return None
+    # Two slices unpack all six axes; no per-axis indexing or generator
+    lx, ly, rx, ry = report[stick_offset:stick_offset + 4]
+    lt, rt = report[trigger_offset:trigger_offset + 2]
+    return (lx / 128.0 - 1.0, ly / 128.0 - 1.0,
+            rx / 128.0 - 1.0, ry / 128.0 - 1.0,
+            lt / 127.5 - 1.0, rt / 127.5 - 1.0)
+
 def joystick_background_loop():
-    global joystick, joystick_axes, is_joystick_connected
-    global joystick_thread_running, device_detect_fail_count
+    global joystick_name, joystick_axes, is_joystick_connected
+    global device_detect_fail_count
     global joystick_vid_pid, active_dev_path, ps_controller_conn_type
 
     polling_interval = 1.0 / 120.0  # Target ~120 FPS for axis updates
+    idle_polling_interval = 0.25 # Seconds between wakeups while no controller is connected
     last_hid_check_time = 0
-    hid_check_interval = 2.0 # Seconds, how often to run list_hid_gamepads if not connected
+    hid_check_interval = 1.0 # Seconds, how often to run list_hid_gamepads if not connected (one enumeration, no probes)
+    next_poll_deadline = 0.0 # perf_counter() time of the next connected poll
+    last_streaming_report_time = None # perf_counter() time of the last USB / BT extended report, None while none seen
+    over_bluetooth = None # Transport of the connected controller, None if it couldn't be determined
+    perf_counter, sleep = time.perf_counter, time.sleep # Hot loop, skip the module attribute lookups
+    stopped, wait = joystick_stop_event.is_set, joystick_stop_event.wait # wait() returns early on shutdown
 
-    while joystick_thread_running:
-        loop_start_time = time.perf_counter()
-        pygame.event.pump() # Essential for Pygame internal state
+    while not stopped():
+        loop_start_time = perf_counter()
 
         if not is_joystick_connected:
             # Try to find and connect to a joystick
-            if time.perf_counter() - last_hid_check_time > hid_check_interval:
-                last_hid_check_time = time.perf_counter()
+            if loop_start_time - last_hid_check_time > hid_check_interval:
+                last_hid_check_time = loop_start_time
                 supported_hid_device = find_supported_sony_controller_hid()
 
                 if supported_hid_device:
                     active_dev_path_candidate = supported_hid_device['path']
                     candidate_vid_pid = (supported_hid_device['vid'], supported_hid_device['pid'])
                     
-                    # Attempt to open the HID device first
+                    # The HID handle is used both for feature reports and for reading axes
                     if utils_hid.open_hid_device(active_dev_path_candidate):
                         active_dev_path = active_dev_path_candidate
                         joystick_vid_pid = candidate_vid_pid
-
-                        # Now try to initialize the corresponding Pygame joystick
-                        pygame.joystick.quit() # Reset Pygame joysticks
-                        pygame.joystick.init() # Re-initialize
-                        
-                        found_pygame_joystick = False
-                        for i in range(pygame.joystick.get_count()):
-                            try:
-                                temp_joystick = pygame.joystick.Joystick(i)
-                                temp_joystick.init()
-                                # Simplistic check: name contains "DualSense" or "Wireless Controller"
-                                # Or check if Pygame GUID contains VID/PID (platform dependent)
-                                pygame_joystick_name = temp_joystick.get_name().lower()
-                                # pygame_guid = temp_joystick.get_guid() # May need parsing
-
-                                if "edge" in pygame_joystick_name or \
-                                   (joystick_vid_pid[0].lower() in pygame_joystick_name and \
-                                    joystick_vid_pid[1].lower() in pygame_joystick_name): # Basic name check
-                                    joystick = temp_joystick
-                                    log_to_terminal(f"Pygame joystick '{joystick.get_name()}' (Index {i}) matched and initialized.")
-                                    found_pygame_joystick = True
-                                    break
-                                else:
-                                    temp_joystick.quit() # Quit if not the one
-                            except pygame.error as e:
-                                log_to_terminal(f"Error initializing Pygame joystick at index {i}: {e}")
-                        
-                        if found_pygame_joystick:
-                            is_joystick_connected = True
-                            device_detect_fail_count = 0
-                            check_sony_controller_connection_type(active_dev_path) # Check connection type
-                            log_to_terminal(f"Controller '{joystick.get_name()}' {ps_controller_conn_type} connected. VID/PID: {joystick_vid_pid[0]}:{joystick_vid_pid[1]}. Path: {active_dev_path}")
-                        else:
-                            log_to_terminal("Supported HID device found, but failed to match/initialize a Pygame joystick.")
-                            utils_hid.close_hid_device(active_dev_path) # Close HID if Pygame part failed
-                            active_dev_path = None
-                            joystick_vid_pid = ("", "")
+                        joystick_name = supported_hid_device['name'] or PS_SUPPORTED_DEVICES[candidate_vid_pid]
+                        is_joystick_connected = True
+                        last_streaming_report_time = None # Report mode unknown until the first report
+                        device_detect_fail_count = 0
+                        check_sony_controller_connection_type(active_dev_path, supported_hid_device['bus_type']) # Check connection type
+                        over_bluetooth = CONNECTION_TYPE_IS_BLUETOOTH.get(ps_controller_conn_type)
+                        joystick_connected_event.set()
+                        controller_status_changed.set()
+                        log_to_terminal(f"Controller '{joystick_name}' {ps_controller_conn_type} connected. VID/PID: {joystick_vid_pid[0]:04X}:{joystick_vid_pid[1]:04X}. Path: {active_dev_path}")
                     else:
                         log_to_terminal(f"Found supported HID device {supported_hid_device['name']} but failed to open its path: {active_dev_path_candidate}")
                         active_dev_path = None # Ensure it's None
                 else: # No supported HID device found
                     device_detect_fail_count +=1
-                    if device_detect_fail_count % 15 == 1: # Log less frequently (e.g. every 30s if interval is 2s)
+                    if device_detect_fail_count % 30 == 1: # Log less frequently (every 30s at a 1s interval)
                          log_to_terminal(f"No supported controller detected (attempt {device_detect_fail_count}). Ensure it's connected.")
         else: # is_joystick_connected is True
-            if not joystick or not active_dev_path or not utils_hid.is_device_responsive(active_dev_path, tries=1, delay=0.01):
-                log_to_terminal(f"Controller '{joystick.get_name() if joystick else 'N/A'}' disconnected or unresponsive.")
+            # Disconnects are detected from the reads themselves (error, or INPUT_REPORT_TIMEOUT_S of
+            # silence in a streaming report mode) instead of a separate probe read every tick.
+            # The short BT simple report may only be sent on state changes, so silence there is normal.
+            report = utils_hid.hid_get_latest_input_report(active_dev_path, 64) if active_dev_path else None
+            if report:
+                # Streaming = USB, or the BT extended report; decided by transport + report ID because
+                # Windows pads BT simple reports to the full length
+                streaming = over_bluetooth is False or report[0] == DS_INPUT_REPORT_BT
+                last_streaming_report_time = loop_start_time if streaming else None
+            elif (report is not None and last_streaming_report_time is not None
+                  and loop_start_time - last_streaming_report_time > INPUT_REPORT_TIMEOUT_S):
+                report = None
+            if report is None:
+                log_to_terminal(f"Controller '{joystick_name or 'N/A'}' disconnected or unresponsive.")
                 if active_dev_path:
                     utils_hid.close_hid_device(active_dev_path)
-                if joystick:
-                    joystick.quit()
                 is_joystick_connected = False
-                joystick = None
+                joystick_connected_event.clear()
+                joystick_name = ""
                 active_dev_path = None
-                joystick_vid_pid = ("", "")
+                joystick_vid_pid = (0, 0)
                 ps_controller_conn_type = ""
                 joystick_axes = (0.0,) * 6 # Reset axes
+                controller_status_changed.set()
                 continue # Skip to next loop iteration to attempt reconnection
 
-            try:
-                axes_count = joystick.get_numaxes()
-                lx = joystick.get_axis(0) if axes_count >= 1 else 0.0
-                ly = joystick.get_axis(1) if axes_count >= 2 else 0.0
-                rx = joystick.get_axis(2) if axes_count >= 3 else 0.0 
-                ry = joystick.get_axis(3) if axes_count >= 4 else 0.0
-                lt = joystick.get_axis(4) if axes_count >= 5 else 0.0 
-                rt = joystick.get_axis(5) if axes_count >= 6 else 0.0 
-                joystick_axes = (lx, ly, rx, ry, lt, rt)
-            except pygame.error as e:
-                log_to_terminal(f"Error reading joystick axes: {e}. Marking as disconnected.")
-                if active_dev_path: utils_hid.close_hid_device(active_dev_path)
-                if joystick: joystick.quit()
-                is_joystick_connected = False
-                joystick = None
-                active_dev_path = None
-                joystick_axes = (0.0,) * 6
-
-        # Precise sleep
-        elapsed_time = time.perf_counter() - loop_start_time
-        sleep_duration = polling_interval - elapsed_time
+            axes = parse_dualsense_axes(report, over_bluetooth)
+            if axes: # Keep the previous axes if nothing new was queued
+                joystick_axes = axes
+
+        if is_joystick_connected:
+            # Fixed deadlines instead of "sleep what's left", so timing errors don't accumulate
+            if next_poll_deadline < loop_start_time - polling_interval:
+                next_poll_deadline = loop_start_time # Fell more than a period behind (or just connected), drop missed polls
+            next_poll_deadline += polling_interval
+            if PRECISE_POLL_TIMING:
+                # sleep() alone is only as exact as the OS timer, so sleep coarsely and spin the last stretch
+                coarse_sleep = next_poll_deadline - perf_counter() - POLL_SPIN_MARGIN_S
+                if coarse_sleep > 0:
+                    wait(coarse_sleep)
+                while perf_counter() < next_poll_deadline:
+                    sleep(0) # Yield the GIL while spinning
+            else:
+                sleep_duration = next_poll_deadline - perf_counter()
+                if sleep_duration > 0:
+                    wait(sleep_duration)
+            continue
+
+        # While disconnected there are no axes to refresh, so only wake up
+        # often enough to notice the next hotplug scan and a shutdown request.
+        sleep_duration = idle_polling_interval - (perf_counter() - loop_start_time)
         if sleep_duration > 0:
-            time.sleep(sleep_duration)
+            wait(sleep_duration)
+
+def joystick_thread_main():
+    """
+    Thread entry point: runs joystick_background_loop() with the Windows timer resolution
+    raised to 1 ms, so sleep() wakes close to each poll deadline instead of on the next
+    ~15.6 ms system tick.
+    """
+    winmm = None
+    if platform.system().lower().startswith('win'):
+        try:
+            import ctypes # Windows-only, checked above
+            winmm = ctypes.windll.winmm
+            winmm.timeBeginPeriod(1)
+        except Exception as e:
+            log_to_terminal(f"Could not raise timer resolution: {e}")
+            winmm = None
+    try:
+        joystick_background_loop()
+    finally:
+        if winmm:
+            winmm.timeEndPeriod(1)
 
 def start_joystick_thread():
-    global joystick_thread, joystick_thread_running
+    global joystick_thread
     if joystick_thread and joystick_thread.is_alive():
         log_to_terminal("Joystick thread already running.")
         return
-    joystick_thread_running = True
-    joystick_thread = threading.Thread(target=joystick_background_loop, daemon=True)
+    joystick_stop_event.clear()
+    joystick_thread = threading.Thread(target=joystick_thread_main, daemon=True)
     joystick_thread.start()
     log_to_terminal("Joystick monitoring thread started.")
 
+def poll_feature_response(report_id, previous):
+    """
+    Re-reads feature report report_id until it differs from previous (what it held before the
+    request was sent), for at most FEATURE_RESPONSE_TIMEOUT_S, instead of a blind 50 ms sleep.
+    The controller usually answers within a few ms. The last read is returned either way, so an
+    answer that happens to equal previous still arrives after the timeout, as before.
+    Without a snapshot (previous is None) a stale answer to an earlier request can't be told
+    apart, so it falls back to the old fixed wait before a single read.
+    """
+    if previous is None:
+        time.sleep(FEATURE_RESPONSE_TIMEOUT_S)
+        return utils_hid.hid_get_feature_report(active_dev_path, report_id, 64)
+    deadline = time.perf_counter() + FEATURE_RESPONSE_TIMEOUT_S
+    while True:
+        time.sleep(FEATURE_RESPONSE_POLL_S)
+        response = utils_hid.hid_get_feature_report(active_dev_path, report_id, 64)
+        if (response and response != previous) or time.perf_counter() >= deadline:
+            return response
+
 def get_controller_serial(): # Renamed from get_serial
     if not is_joystick_connected or not active_dev_path:
         log_to_terminal("Get Serial: Controller not connected or no active HID path.")
@@ -515,14 +706,13 @@ def get_controller_serial(): # Renamed from get_serial
         return "Not available (Unsupported Device)"
 
     try:
-        set_success = utils_hid.hid_set_feature_report(active_dev_path, 0x80, [0x01, 0x13, 0x01])
+        previous_response = utils_hid.hid_get_feature_report(active_dev_path, 0x81, 64)
+        set_success = utils_hid.hid_set_feature_report(active_dev_path, 0x80, DS_REQUEST_SERIAL)
         if not set_success:
             log_to_terminal("Get Serial: Failed to send request for serial.")
             return "Serial request failed."
 
-        time.sleep(0.05) # Small delay
-
-        serial_list = utils_hid.hid_get_feature_report(active_dev_path, 0x81, 64)
+        serial_list = poll_feature_response(0x81, previous_response)
         if not serial_list:
             log_to_terminal("Get Serial: No response or empty data for serial.")
             return "Serial not found (no data)."
@@ -531,32 +721,19 @@ def get_controller_serial(): # Renamed from get_serial
              log_to_terminal(f"Get Serial: Expected report ID 0x81, got {serial_list[0]}.")
              return "Serial not found (wrong report)."
         
-        full_report_hex = bytes(serial_list).hex()
-        # Original slicing [8:42] means hex chars from index 8 up to (but not including) 42.
-        # This corresponds to byte indices 4 through 20 ( (8/2) to (42/2 - 1) ).
-        # So, 17 bytes: data_bytes[4], data_bytes[5], ..., data_bytes[20].
-        serial_hex_segment = full_report_hex[8:42] 
+        # The ASCII serial sits in bytes 4 through 20 (17 bytes) of the report.
+        serial_bytes = serial_list[4:21] # hid_get_feature_report() returns bytes
+        if not serial_bytes:
+            log_to_terminal("Get Serial: Report too short to contain a serial.")
+            return "Serial not found (no segment)."
 
-        if serial_hex_segment:
-            try:
-                # Ensure the segment length is even for bytes.fromhex
-                if len(serial_hex_segment) % 2 != 0:
-                    log_to_terminal(f"Get Serial: Extracted hex segment has odd length: '{serial_hex_segment}'")
-                    return "Serial not found (hex format error)."
-
-                decoded_serial = bytes.fromhex(serial_hex_segment).decode("ascii", errors="ignore").strip().upper()
-                if decoded_serial:
-                    log_to_terminal(f"Serial Number: {decoded_serial}")
-                    return decoded_serial
-                else:
-                    log_to_terminal("Get Serial: Decoded serial is empty.")
-                    return "Serial not found (empty)."
-            except ValueError as e:
-                log_to_terminal(f"Get Serial: Error decoding serial hex '{serial_hex_segment}': {e}")
-                return "Serial not found (decode error)."
+        decoded_serial = serial_bytes.decode("ascii", errors="ignore").strip().upper()
+        if decoded_serial:
+            log_to_terminal(f"Serial Number: {decoded_serial}")
+            return decoded_serial
         else:
-            log_to_terminal("Get Serial: Extracted serial hex segment is empty.")
-            return "Serial not found (no segment)."
+            log_to_terminal("Get Serial: Decoded serial is empty.")
+            return "Serial not found (empty)."
     except Exception as e:
         log_to_terminal(f"Error obtaining Serial: {e}")
         return f"Error obtaining Serial: {type(e).__name__}"
@@ -571,15 +748,13 @@ def get_calibration_data_from_ds(): # Renamed
         return None
 
     try:
-        set_payload = [0x0C, 0x04, 0x00] # Request for calibration data
-        set_success = utils_hid.hid_set_feature_report(active_dev_path, 0x80, set_payload)
+        previous_response = utils_hid.hid_get_feature_report(active_dev_path, 0x81, 64)
+        set_success = utils_hid.hid_set_feature_report(active_dev_path, 0x80, DS_REQUEST_CALIBRATION)
         if not set_success:
             log_to_terminal("Get Calib: Failed to send request for calibration data.")
             return None
 
-        time.sleep(0.05) # Small delay
-
-        calib_report = utils_hid.hid_get_feature_report(active_dev_path, 0x81, 64) 
+        calib_report = poll_feature_response(0x81, previous_response)
         if not calib_report:
             log_to_terminal("Get Calib: No response or empty data for calibration.")
             return None
@@ -588,16 +763,14 @@ def get_calibration_data_from_ds(): # Renamed
             log_to_terminal(f"Get Calib: Expected report ID 0x81, got {calib_report[0]}.")
             return None
 
-        # Original code used: calibration_data = list(raw_bytes[4:])
-        # where raw_bytes was from bytes.fromhex(calib_hex[0:64]).
-        # This means it used bytes 4 through 31 of the *full report*.
-        # calib_report is already a list of integers (bytes).
-        if len(calib_report) >= 32: 
-            calibration_payload = list(calib_report[4:32]) # Bytes 4 to 31 of the full report.
-            log_to_terminal(f"Raw calibration payload (bytes 4-31 of report): {calibration_payload}")
+        # The calibration payload is bytes 4 through 31 of the full report.
+        # It is kept as bytes from here through save/load/apply.
+        if len(calib_report) >= 4 + DS_CALIBRATION_LEN: 
+            calibration_payload = calib_report[4:4 + DS_CALIBRATION_LEN]
+            log_to_terminal(f"Raw calibration payload (bytes 4-31 of report): {calibration_payload.hex(' ')}")
             return calibration_payload
         else:
-            log_to_terminal(f"Get Calib: Report too short ({len(calib_report)} bytes, expected >=32).")
+            log_to_terminal(f"Get Calib: Report too short ({len(calib_report)} bytes, expected >={4 + DS_CALIBRATION_LEN}).")
             return None
 
     except Exception as e:
@@ -606,24 +779,24 @@ def get_calibration_data_from_ds(): # Renamed
 
 def read_calibration_from_controller():
     controller_name_str = "No Controller"
-    if joystick and is_joystick_connected:
-        controller_name_str = joystick.get_name()
+    if is_joystick_connected:
+        controller_name_str = joystick_name
         if ps_controller_conn_type:
             controller_name_str += f" {ps_controller_conn_type}"
 
     serial_str = get_controller_serial() 
 
-    calibration_byte_list = get_calibration_data_from_ds()
+    calibration_data = get_calibration_data_from_ds()
 
-    if calibration_byte_list is None:
+    if calibration_data is None:
         log_to_terminal("Failed to read calibration data from controller for CSV.")
-        return serial_str, [], controller_name_str # Return empty list for data if failed
+        return serial_str, b"", controller_name_str # Return empty bytes for data if failed
 
-    log_to_terminal(f"Successfully read calibration data for CSV: {calibration_byte_list}")
-    return serial_str, calibration_byte_list, controller_name_str
+    log_to_terminal(f"Successfully read calibration data for CSV: {calibration_data.hex(' ')}")
+    return serial_str, calibration_data, controller_name_str
 
 
-def apply_calibration_to_controller(calibration_data_list): 
+def apply_calibration_to_controller(calibration_data): 
     if not is_joystick_connected or not active_dev_path:
         messagebox.showerror("Error", "No device connected or active device path not found.")
         log_to_terminal("Apply Calib: No device connected.")
@@ -632,17 +805,16 @@ def apply_calibration_to_controller(calibration_data_list):
         log_to_terminal("Calibration writing not supported when using Bluetooth.")
         messagebox.showwarning("Bluetooth Mode", "Calibration writing is not supported over Bluetooth.")
         return False
-    if not isinstance(calibration_data_list, list):
-        log_to_terminal(f"Apply Calib: Invalid data format (expected list, got {type(calibration_data_list)}).")
+    if not isinstance(calibration_data, (bytes, bytearray)):
+        log_to_terminal(f"Apply Calib: Invalid data format (expected bytes, got {type(calibration_data)}).")
         messagebox.showerror("Error", "Invalid calibration data format.")
         return False
 
     try:
         report_id = 0x80
-        # Ensure calibration_data_list contains only integers (bytes)
-        payload = [0x0C, 0x01] + [int(b) for b in calibration_data_list]
+        payload = DS_WRITE_CALIBRATION_PREFIX + calibration_data
 
-        log_to_terminal(f"Applying calibration data (len {len(calibration_data_list)}): {payload}") # Log full payload
+        log_to_terminal(f"Applying calibration data (len {len(calibration_data)}): {payload.hex(' ')}") # Log full payload
         success = utils_hid.hid_set_feature_report(active_dev_path, report_id, payload)
         if success:
             log_to_terminal("Calibration data applied successfully to controller.")
@@ -665,63 +837,96 @@ def load_calibration_and_apply():
     if file_path:
         load_calibration_from_file(file_path, apply_to_controller=True)
 
+def parse_calibration_file(file_path):
+    """
+    Reads a calibration CSV and returns (serial_number, controller_name, calibration_data bytes).
+    Raises ValueError for malformed files and OSError if the file can't be read. Touches no
+    Tk state, so it is safe to call from a worker thread. The parsed result is reused for as
+    long as the file's mtime and size stay the same.
+    """
+    file_stat = os.stat(file_path)
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _calibration_file_cache.get(file_path)
+    if cached and cached[0] == file_version:
+        parsed = cached[1]
+    else:
+        parsed = read_calibration_csv(file_path)
+        _calibration_file_cache[file_path] = (file_version, parsed)
+
+    serial_number, controller_name, calibration_data = parsed
+    log_to_terminal(
+        f"Loaded Calibration from '{os.path.basename(file_path)}':\n"
+        f"  Serial: {serial_number}\n"
+        f"  Controller: {controller_name}\n"
+        f"  Data (first 10 bytes): {calibration_data[:10].hex(' ')}..."
+    )
+    return parsed
+
+def read_calibration_csv(file_path):
+    """
+    Uncached parse behind parse_calibration_file(). The file is only a header plus one data row,
+    so it is read in one go and split directly instead of going through csv.reader.
+    """
+    with open(file_path, 'rb') as csvfile:
+        lines = csvfile.read().split(b"\n", 2)
+    header = lines[0].split(b",", 1)[0].strip(b' "\r').lower()
+    if header != b"serial number":
+        raise ValueError("CSV file does not appear to be a valid calibration file (header mismatch).")
+
+    # maxsplit=2: a legacy list payload ("[1, 2, ...]") contains commas of its own
+    data_row = [field.decode('utf-8', 'replace').strip(' "\r') for field in lines[1].split(b",", 2)] if len(lines) > 1 else []
+    if not any(data_row):
+        raise ValueError(f"Calibration file is empty or improperly formatted: {os.path.basename(file_path)}")
+    if len(data_row) < 3:
+        raise ValueError(f"Calibration file has no calibration data column: {os.path.basename(file_path)}")
+    serial_number, controller_name, calibration_data_str = data_row
+
+    try:
+        if calibration_data_str.lstrip().startswith("["):
+            # Legacy files store the payload as a Python list literal
+            legacy_list = ast.literal_eval(calibration_data_str)
+            if not isinstance(legacy_list, list):
+                raise ValueError("Parsed calibration data is not a list.")
+            calibration_data = bytes(legacy_list) # Also rejects values outside 0..255
+        else:
+            calibration_data = bytes.fromhex(calibration_data_str)
+    except (ValueError, SyntaxError, TypeError) as e:
+        raise ValueError(f"Invalid calibration data format in CSV: {e} - Data was: '{calibration_data_str}'") from e
+    # Anything else would be written to the controller as a malformed calibration report
+    if len(calibration_data) != DS_CALIBRATION_LEN:
+        raise ValueError(f"Invalid calibration data length in CSV: expected {DS_CALIBRATION_LEN} bytes, got {len(calibration_data)}.")
+    return serial_number, controller_name, calibration_data
+
 def load_calibration_from_file(file_path, apply_to_controller=False):
     log_to_terminal(f"Loading calibration from: {file_path}")
     try:
-        with open(file_path, newline='') as csvfile:
-            reader = csv.reader(csvfile)
-            header = next(reader) 
-            if not header or header[0].lower() != "serial number": 
-                raise ValueError("CSV file does not appear to be a valid calibration file (header mismatch).")
-            
-            data_row = next(reader)
-            serial_number = data_row[0]
-            controller_name = data_row[1] if len(data_row) > 1 else "Unknown"
-            calibration_data_str = data_row[2] if len(data_row) > 2 else data_row[1] # Fallback
-
-            try:
-                calibration_data_list = ast.literal_eval(calibration_data_str)
-                if not isinstance(calibration_data_list, list):
-                    raise ValueError("Parsed calibration data is not a list.")
-            except (ValueError, SyntaxError) as e:
-                log_to_terminal(f"Error parsing calibration data from CSV: {e} - Data was: '{calibration_data_str}'")
-                messagebox.showerror("Error", f"Invalid calibration data format in CSV:\n{e}")
-                return
-
-            log_to_terminal(
-                f"Loaded Calibration from '{os.path.basename(file_path)}':\n"
-                f"  Serial: {serial_number}\n"
-                f"  Controller: {controller_name}\n"
-                f"  Data (first 10 bytes): {calibration_data_list[:10]}..."
-            )
-            if apply_to_controller:
-                apply_calibration_to_controller(calibration_data_list)
-            else:
-                log_to_terminal("Calibration data loaded but not applied (apply_to_controller=False).")
-
-    except StopIteration:
-        log_to_terminal(f"Calibration file '{file_path}' is empty or has no data rows.")
-        messagebox.showerror("Error", f"Calibration file is empty or improperly formatted:\n{os.path.basename(file_path)}")
+        _, _, calibration_data = parse_calibration_file(file_path)
     except Exception as e:
         log_to_terminal(f"Failed to load calibration file '{file_path}': {e}")
         messagebox.showerror("Error", f"Failed to load calibration file:\n{e}")
+        return
+
+    if apply_to_controller:
+        apply_calibration_to_controller(calibration_data)
+    else:
+        log_to_terminal("Calibration data loaded but not applied (apply_to_controller=False).")
 
 
 def save_calibration_to_file(): 
-    serial_number_str, calibration_data_list, controller_name_str = read_calibration_from_controller()
+    serial_number_str, calibration_data, controller_name_str = read_calibration_from_controller()
 
-    if not calibration_data_list : 
+    if not calibration_data : 
         messagebox.showwarning("Save Calibration", "No calibration data read from controller to save.")
         log_to_terminal("Save Calib: No data from controller.")
         return
 
-    calibration_str_for_csv = str(calibration_data_list)
+    calibration_str_for_csv = calibration_data.hex()
 
     default_filename = "controller_calibration.csv"
-    if controller_name_str != "No Controller" and serial_number_str not in ["Controller not connected.", "Serial not found (no data).", "Serial not found (wrong report).", "Serial not found (empty).", "Serial not found (decode error).", "Serial not found (no segment).", "Serial request failed."]: # More robust check
+    if controller_name_str != "No Controller" and serial_number_str not in SERIAL_ERROR_STRINGS:
         try:
-            safe_controller_name = "".join(c if c.isalnum() else "_" for c in controller_name_str.split(" ")[0]) 
-            safe_serial = "".join(c if c.isalnum() else "_" for c in serial_number_str)
+            safe_controller_name = FILENAME_UNSAFE_RE.sub("_", controller_name_str.split(" ", 1)[0])
+            safe_serial = FILENAME_UNSAFE_RE.sub("_", serial_number_str)
             default_filename = f"{safe_controller_name}_{safe_serial}_calib.csv"
         except Exception as e:
             log_to_terminal(f"Error creating default filename: {e}")
@@ -737,10 +942,10 @@ def save_calibration_to_file():
         log_to_terminal("Save calibration cancelled by user.")
         return
     try:
-        with open(file_path, mode="w", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["Serial Number", "Controller Name", "Calibration Data (List of Bytes as String)"])
-            writer.writerow([serial_number_str, controller_name_str, calibration_str_for_csv])
+        # Two fixed rows and a hex payload need no csv quoting, only keep ',' and '"' out of the text fields
+        row = ",".join(field.replace(",", ";").replace('"', "'") for field in (serial_number_str, controller_name_str))
+        with open(file_path, mode="w", newline="", encoding="utf-8") as csvfile:
+            csvfile.write(f"Serial Number,Controller Name,Calibration Data (Hex)\r\n{row},{calibration_str_for_csv}\r\n")
         messagebox.showinfo("Success", f"Calibration saved successfully to:\n{os.path.basename(file_path)}")
         log_to_terminal(f"Calibration saved to {file_path}")
     except Exception as e:
@@ -751,140 +956,262 @@ def auto_load_calibration_on_startup():
     if autoload_calibration_var.get() and startup_calibration_file_path_var.get():
         startup_path = startup_calibration_file_path_var.get()
         log_to_terminal(f"Autoload Calibration enabled. Attempting to load: {startup_path}")
+        show_errors = not start_minimized_var.get() # Log-only when starting in the tray; read here, on the Tk thread
         if os.path.exists(startup_path):
-            def delayed_load():
-                # Wait until joystick is actually connected before trying to apply
-                for _ in range(10): # Try for up to 10 seconds (5 * 200ms)
-                    if is_joystick_connected and active_dev_path:
-                        log_to_terminal(f"Autoload: Controller connected. Applying calibration from {startup_path}")
-                        load_calibration_from_file(startup_path, apply_to_controller=True)
-                        return
-                    time.sleep(0.2) # Check every 200ms
-                log_to_terminal("Autoload: Controller not connected after waiting. Will not apply calibration automatically.")
-
-            # This schedules delayed_load to run after some time, giving joystick_background_loop a chance
-            if root and root.winfo_exists(): # Ensure root is still valid
-                root.after(1000, delayed_load) # Initial delay of 1s before starting checks
-            else:
-                threading.Thread(target=delayed_load).start() # Fallback if root is gone (e.g. headless mode someday)
-
+            # File parsing and waiting for the controller happen off the Tk thread
+            threading.Thread(target=autoload_calibration_worker, args=(startup_path, show_errors), daemon=True).start()
         else:
             log_to_terminal(f"Startup calibration file not found: {startup_path}")
-            if gui_ready_and_valid: # Only show messagebox if GUI is up
-                 messagebox.showwarning("Autoload Calibration", f"Startup calibration file not found:\n{startup_path}")
+            # Deferred so the modal dialog does not hold up startup
+            if gui_ready_and_valid and show_errors:
+                root.after(0, lambda: messagebox.showwarning("Autoload Calibration", f"Startup calibration file not found:\n{startup_path}"))
+
+
+def autoload_calibration_worker(startup_path, show_errors=True):
+    """
+    Parses the startup calibration file and waits for the controller without blocking the GUI,
+    then hands the apply step (HID write + message boxes) back to the Tk thread.
+    Makes no Tk calls itself: show_errors is read from start_minimized_var by the caller.
+    """
+    try:
+        _, _, calibration_data = parse_calibration_file(startup_path)
+    except Exception as e:
+        log_to_terminal(f"Autoload: Failed to load calibration file '{startup_path}': {e}")
+        error_message = f"Failed to load calibration file:\n{e}" # e is unbound once the except block ends
+        if show_errors:
+            _pending_tk_calls.append(lambda: messagebox.showerror("Autoload Calibration", error_message))
+        return
+
+    # Wait until joystick is actually connected before trying to apply, woken as soon as it connects
+    if not joystick_connected_event.wait(timeout=AUTOLOAD_CONNECT_TIMEOUT_S):
+        log_to_terminal("Autoload: Controller not connected after waiting. Will not apply calibration automatically.")
+        return
 
+    log_to_terminal(f"Autoload: Controller connected. Applying calibration from {startup_path}")
+    _pending_tk_calls.append(lambda: apply_calibration_to_controller(calibration_data))
 
 def update_controller_status_display(): 
+    global _last_controller_status_text
     status_text = "Connected Controller:\n"
-    if is_joystick_connected and joystick:
-        name = joystick.get_name()
+    if is_joystick_connected:
+        name = joystick_name
         if joystick_vid_pid in PS_SUPPORTED_DEVICES and ps_controller_conn_type:
             name += f" {ps_controller_conn_type}"
         status_text += name
-        status_text += f"\nVID:PID: {joystick_vid_pid[0]}:{joystick_vid_pid[1]}"
+        status_text += f"\nVID:PID: {joystick_vid_pid[0]:04X}:{joystick_vid_pid[1]:04X}"
     else:
         status_text += "None"
     
-    if controller_status_label and controller_status_label.winfo_exists():
+    # Only touch the label when the text changed, a config() forces a widget redraw
+    if status_text != _last_controller_status_text and controller_status_label and controller_status_label.winfo_exists():
         controller_status_label.config(text=status_text)
-    
-    if root and root.winfo_exists(): 
-        root.after(1000, update_controller_status_display) 
+        _last_controller_status_text = status_text
+
+def create_analog_canvas_items():
+    """
+    Creates every analog canvas item once (hidden, zero-sized). Later frames only move
+    them with coords() and toggle their state, instead of delete("all") + create_* per frame.
+    """
+    global _analog_canvas_connected_view
+    _canvas_items.clear()
+    _analog_canvas_connected_view = None # New items start hidden, force the next view switch
+    for side in ("left", "right"):
+        _canvas_items[f"{side}_circle"] = analog_canvas.create_oval(0, 0, 0, 0, outline=COLOR_HIGHLIGHT, width=2, state="hidden")
+        _canvas_items[f"{side}_vline"] = analog_canvas.create_line(0, 0, 0, 0, fill=COLOR_HIGHLIGHT, width=1, dash=(4, 4), state="hidden")
+        _canvas_items[f"{side}_hline"] = analog_canvas.create_line(0, 0, 0, 0, fill=COLOR_HIGHLIGHT, width=1, dash=(4, 4), state="hidden")
+    for side, dot_color in (("left", COLOR_LEFT_DOT), ("right", COLOR_RIGHT_DOT)):
+        _canvas_items[f"{side}_dot"] = analog_canvas.create_oval(0, 0, 0, 0, fill=dot_color, outline=COLOR_BG_DARK, state="hidden")
+    for side, dot_color in (("left", COLOR_LEFT_DOT), ("right", COLOR_RIGHT_DOT)):
+        _canvas_items[f"{side}_trigger_fill"] = analog_canvas.create_rectangle(0, 0, 0, 0, fill=dot_color, outline=COLOR_HIGHLIGHT, state="hidden")
+        _canvas_items[f"{side}_trigger_outline"] = analog_canvas.create_rectangle(0, 0, 0, 0, outline=COLOR_HIGHLIGHT, state="hidden")
+    _canvas_items["no_joystick_text"] = analog_canvas.create_text(
+        0, 0, text="No Supported Joystick Connected\nor Detected",
+        fill=COLOR_TEXT_DIM, font=("Arial", 14), justify="center", state="hidden"
+    )
+
+def schedule_next_ui_tick(tick_start, visible=True):
+    """
+    Reschedules ui_tick so that the measured tick period converges on DRAW_INTERVAL_MS.
+    Both the tick's own cost and how late Tk fires after() timers are predicted from the
+    median of recent samples and subtracted from the requested delay. Without a controller,
+    or while the window is hidden/in the tray, it only ticks every DRAW_IDLE_INTERVAL_MS.
+    """
+    global _expected_tick_time
+    if not root or not root.winfo_exists():
+        return
+    if not is_joystick_connected or not visible:
+        _expected_tick_time = None # Idle ticks are not paced, don't sample their cost or lateness
+        root.after(DRAW_IDLE_INTERVAL_MS, ui_tick)
+        return
+    _draw_net_delays.append(time.perf_counter() - tick_start)
+    predicted_ms = statistics.median(_draw_net_delays) * 1000
+    if _tick_lateness:
+        predicted_ms += statistics.median(_tick_lateness) * 1000
+    delay_ms = max(1, int(DRAW_INTERVAL_MS - predicted_ms))
+    _expected_tick_time = time.perf_counter() + delay_ms / 1000
+    root.after(delay_ms, ui_tick)
+
+def ui_tick():
+    """
+    The single periodic Tk timer: redraws the analog sticks every tick, writes queued log
+    lines, runs the callables worker threads queued in _pending_tk_calls and refreshes the
+    controller status only after the joystick thread reported a connect/disconnect.
+    One timer means one event loop wakeup per frame.
+    """
+    if not root or not root.winfo_exists():
+        return
+    tick_start = time.perf_counter()
+    if _expected_tick_time is not None:
+        _tick_lateness.append(max(0.0, tick_start - _expected_tick_time))
+    visible = True
+    # Re-arm in finally: this is the only UI timer, an exception must not stop the redraw, log and status for good
+    try:
+        visible = root.winfo_viewable() # False while minimized or hidden to the tray
+        if visible:
+            draw_analog_sticks_on_canvas()
+        flush_log_queue()
+        while _pending_tk_calls:
+            call = _pending_tk_calls.popleft()
+            try:
+                call()
+            except Exception as e:
+                log_to_terminal(f"Error in queued UI callback: {e}")
+
+        if controller_status_changed.is_set():
+            controller_status_changed.clear() # Clear first so a change during the refresh isn't lost
+            update_controller_status_display()
+    finally:
+        schedule_next_ui_tick(tick_start, visible)
+
+def on_analog_canvas_configure(event):
+    """Recomputes the analog layout only when the canvas is actually resized."""
+    update_analog_geometry(event.width, event.height)
+
+def update_analog_geometry(canvas_width, canvas_height):
+    """
+    Caches every canvas-size dependent value in _analog_geometry and moves the static items
+    (circles, crosshairs, trigger outlines, fallback text). Per-frame drawing then only
+    needs dict lookups and the dot/trigger-fill positions.
+    """
+    radius = min(canvas_width, canvas_height) // 5 
+    stick_area_width = canvas_width // 2
+    trigger_bar_height = 10
+    _analog_geometry.update(
+        width=canvas_width,
+        height=canvas_height,
+        radius=radius,
+        left_center=(stick_area_width // 2, canvas_height // 2),
+        right_center=(stick_area_width + (canvas_width - stick_area_width) // 2, canvas_height // 2),
+        trigger_bar_width=radius * 1.5,
+        trigger_bar_height=trigger_bar_height,
+        trigger_y_pos=canvas_height - trigger_bar_height - 10,
+    )
+    if _canvas_items:
+        position_static_analog_items()
+
+def position_static_analog_items():
+    global _last_drawn_axes
+    _last_drawn_axes = None # Layout changed, the dots/trigger fills must be moved again
+    geo = _analog_geometry
+    radius = geo["radius"]
+    trigger_bar_width = geo["trigger_bar_width"]
+    trigger_y_pos = geo["trigger_y_pos"]
+    for side in ("left", "right"):
+        center_x, center_y = geo[f"{side}_center"]
+        analog_canvas.coords(_canvas_items[f"{side}_circle"],
+                             center_x - radius, center_y - radius,
+                             center_x + radius, center_y + radius)
+        analog_canvas.coords(_canvas_items[f"{side}_vline"],
+                             center_x, center_y - radius,
+                             center_x, center_y + radius)
+        analog_canvas.coords(_canvas_items[f"{side}_hline"],
+                             center_x - radius, center_y,
+                             center_x + radius, center_y)
+        analog_canvas.coords(_canvas_items[f"{side}_trigger_outline"],
+                             center_x - trigger_bar_width/2, trigger_y_pos,
+                             center_x + trigger_bar_width/2, trigger_y_pos + geo["trigger_bar_height"])
+    analog_canvas.coords(_canvas_items["no_joystick_text"], geo["width"] / 2, geo["height"] / 2)
+
+def set_analog_canvas_view(connected):
+    """
+    Switches between the stick view and the 'no joystick' text by toggling item states.
+    Only touches the items when the view actually changes, so steady-state frames issue no itemconfigure.
+    """
+    global _analog_canvas_connected_view
+    if connected == _analog_canvas_connected_view:
+        return
+    stick_state = "normal" if connected else "hidden"
+    for key, item_id in _canvas_items.items():
+        if key == "no_joystick_text":
+            analog_canvas.itemconfigure(item_id, state="hidden" if connected else "normal")
+        else:
+            analog_canvas.itemconfigure(item_id, state=stick_state)
+    _analog_canvas_connected_view = connected
 
 def draw_analog_sticks_on_canvas(): 
+    global _last_drawn_axes
     if not analog_canvas or not root or not analog_canvas.winfo_exists() or not root.winfo_exists():
         return
-        
-    analog_canvas.delete("all")
-    canvas_width = analog_canvas.winfo_width()
-    canvas_height = analog_canvas.winfo_height()
 
-    if canvas_width < 50 or canvas_height < 50 : 
-        if root and root.winfo_exists(): root.after(DRAW_INTERVAL_MS, draw_analog_sticks_on_canvas)
-        return
+    if not _canvas_items:
+        create_analog_canvas_items()
+        if _analog_geometry:
+            position_static_analog_items()
 
-    if joystick and is_joystick_connected:
-        lx, ly, rx, ry, lt, rt = joystick_axes 
-        
-        radius = min(canvas_width, canvas_height) // 5 
-        stick_area_width = canvas_width // 2
+    geo = _analog_geometry
+    if not geo or geo["width"] < 50 or geo["height"] < 50 : 
+        return
 
-        left_center_x = stick_area_width // 2
-        left_center_y = canvas_height // 2
-        
-        right_center_x = stick_area_width + (canvas_width - stick_area_width) // 2
-        right_center_y = canvas_height // 2
-
-        analog_canvas.create_oval(left_center_x - radius, left_center_y - radius,
-                                  left_center_x + radius, left_center_y + radius,
-                                  outline=COLOR_HIGHLIGHT, width=2)
-        analog_canvas.create_line(left_center_x, left_center_y - radius,
-                                  left_center_x, left_center_y + radius,
-                                  fill=COLOR_HIGHLIGHT, width=1, dash=(4, 4))
-        analog_canvas.create_line(left_center_x - radius, left_center_y,
-                                  left_center_x + radius, left_center_y,
-                                  fill=COLOR_HIGHLIGHT, width=1, dash=(4, 4))
-        analog_canvas.create_oval(right_center_x - radius, right_center_y - radius,
-                                  right_center_x + radius, right_center_y + radius,
-                                  outline=COLOR_HIGHLIGHT, width=2)
-        analog_canvas.create_line(right_center_x, right_center_y - radius,
-                                  right_center_x, right_center_y + radius,
-                                  fill=COLOR_HIGHLIGHT, width=1, dash=(4, 4))
-        analog_canvas.create_line(right_center_x - radius, right_center_y,
-                                  right_center_x + radius, right_center_y,
-                                  fill=COLOR_HIGHLIGHT, width=1, dash=(4, 4))
+    connected = is_joystick_connected
+    set_analog_canvas_view(connected)
 
+    if not connected:
+        return
+    lx, ly, rx, ry, lt, rt = joystick_axes
+    radius = geo["radius"]
+    trigger_bar_width = geo["trigger_bar_width"]
+    # Compare at canvas pixel resolution: resting sticks and sub-pixel sensor noise cost no Tk calls
+    half_trigger = trigger_bar_width / 2
+    axes_key = (round(lx * radius), round(ly * radius), round(rx * radius), round(ry * radius),
+                round(lt * half_trigger), round(rt * half_trigger))
+    if axes_key != _last_drawn_axes:
+        _last_drawn_axes = axes_key
         dot_radius = 8 
-        l_dot_x = left_center_x + lx * radius
-        l_dot_y = left_center_y + ly * radius
-        analog_canvas.create_oval(l_dot_x - dot_radius, l_dot_y - dot_radius,
-                                  l_dot_x + dot_radius, l_dot_y + dot_radius,
-                                  fill=COLOR_LEFT_DOT, outline=COLOR_BG_DARK)
-        r_dot_x = right_center_x + rx * radius
-        r_dot_y = right_center_y + ry * radius
-        analog_canvas.create_oval(r_dot_x - dot_radius, r_dot_y - dot_radius,
-                                  r_dot_x + dot_radius, r_dot_y + dot_radius,
-                                  fill=COLOR_RIGHT_DOT, outline=COLOR_BG_DARK)
-                                  
-        trigger_bar_width = radius * 1.5
-        trigger_bar_height = 10
-        trigger_y_pos = canvas_height - trigger_bar_height - 10 
-
-        lt_normalized = (lt + 1) / 2
-        analog_canvas.create_rectangle(left_center_x - trigger_bar_width/2, trigger_y_pos,
-                                       left_center_x - trigger_bar_width/2 + trigger_bar_width * lt_normalized, trigger_y_pos + trigger_bar_height,
-                                       fill=COLOR_LEFT_DOT, outline=COLOR_HIGHLIGHT)
-        analog_canvas.create_rectangle(left_center_x - trigger_bar_width/2, trigger_y_pos,
-                                       left_center_x + trigger_bar_width/2, trigger_y_pos + trigger_bar_height,
-                                       outline=COLOR_HIGHLIGHT) 
-
-        rt_normalized = (rt + 1) / 2
-        analog_canvas.create_rectangle(right_center_x - trigger_bar_width/2, trigger_y_pos,
-                                       right_center_x - trigger_bar_width/2 + trigger_bar_width * rt_normalized, trigger_y_pos + trigger_bar_height,
-                                       fill=COLOR_RIGHT_DOT, outline=COLOR_HIGHLIGHT)
-        analog_canvas.create_rectangle(right_center_x - trigger_bar_width/2, trigger_y_pos,
-                                       right_center_x + trigger_bar_width/2, trigger_y_pos + trigger_bar_height,
-                                       outline=COLOR_HIGHLIGHT) 
+        trigger_y_pos = geo["trigger_y_pos"]
 
-    else:
-        analog_canvas.create_text(canvas_width / 2,
-                                  canvas_height / 2,
-                                  text="No Supported Joystick Connected\nor Detected",
-                                  fill=COLOR_TEXT_DIM,
-                                  font=("Arial", 14),
-                                  justify="center")
-    if root and root.winfo_exists(): 
-      root.after(DRAW_INTERVAL_MS, draw_analog_sticks_on_canvas)
+        for side, stick_x, stick_y, trigger in (("left", lx, ly, lt), ("right", rx, ry, rt)):
+            center_x, center_y = geo[f"{side}_center"]
+            dot_x = center_x + stick_x * radius
+            dot_y = center_y + stick_y * radius
+            analog_canvas.coords(_canvas_items[f"{side}_dot"],
+                                 dot_x - dot_radius, dot_y - dot_radius,
+                                 dot_x + dot_radius, dot_y + dot_radius)
+
+            trigger_normalized = (trigger + 1) / 2
+            analog_canvas.coords(_canvas_items[f"{side}_trigger_fill"],
+                                 center_x - trigger_bar_width/2, trigger_y_pos,
+                                 center_x - trigger_bar_width/2 + trigger_bar_width * trigger_normalized, trigger_y_pos + geo["trigger_bar_height"])
 
 def main():
     global root, terminal_text, analog_canvas, controller_status_label
     global autoload_checkbox_var, start_minimized_var, autoload_calibration_var, startup_calibration_file_path_var
-    global joystick_thread_running, gui_ready_and_valid 
+    global gui_ready_and_valid
 
     root = tk.Tk()
     root.withdraw() 
     root.title("DriftGuard Calibration Utility (Ransa Remake for 8k polling rate)") # Consider adding version
     root.configure(bg=COLOR_BG_DARK)
+    # Dark theme for the classic tk buttons, set once in the option database instead of
+    # being repeated as color kwargs on every Button/Checkbutton
+    for option, value in (
+        ("*Button.background", COLOR_BUTTON_BG), ("*Button.foreground", COLOR_TEXT_LIGHT),
+        ("*Button.activeBackground", COLOR_BUTTON_ACTIVE), ("*Button.activeForeground", COLOR_TEXT_LIGHT),
+        ("*Button.borderWidth", 1), ("*Button.relief", "raised"),
+        ("*Checkbutton.background", COLOR_BG_DARK), ("*Checkbutton.foreground", COLOR_TEXT_LIGHT),
+        ("*Checkbutton.activeBackground", COLOR_BG_DARK), ("*Checkbutton.activeForeground", COLOR_TEXT_LIGHT),
+        ("*Checkbutton.selectColor", COLOR_CHECK_SELECT), ("*Checkbutton.anchor", "w"),
+    ):
+        root.option_add(option, value)
     root.protocol("WM_DELETE_WINDOW", on_close_window) 
     root.bind("<Unmap>", on_minimize_window) 
 
@@ -895,9 +1222,8 @@ def main():
     root.minsize(window_width - 100, window_height - 100) # Allow more shrinking
     root.resizable(True, True) 
 
-    icon_path = resource_path("data/icon_drift_guard_main.ico")
     try:
-        root.iconbitmap(icon_path)
+        root.iconbitmap(ICON_PATH)
     except Exception as e:
         print(f"[Icon Error] Icon not loaded: {e}") 
 
@@ -910,7 +1236,9 @@ def main():
     startup_calibration_file_path_var = tk.StringVar()
     startup_calibration_file_path_var.trace_add("write", on_startup_file_change)
 
-    threaded_load_settings() 
+    # Loaded synchronously: it is one small JSON file, it sets Tk variables (Tk thread only), and
+    # start_minimized must be known before main() decides whether to show the window
+    load_settings()
 
     button_frame = tk.Frame(root, bg=COLOR_BG_DARK)
     button_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10,5)) 
@@ -919,69 +1247,61 @@ def main():
 
     load_button = tk.Button(
         button_inner_frame, text="Load Calibration from CSV",
-        width=25, command=load_calibration_and_apply, 
-        bg=COLOR_BUTTON_BG, fg=COLOR_TEXT_LIGHT,
-        activebackground=COLOR_BUTTON_ACTIVE,
-        activeforeground=COLOR_TEXT_LIGHT, bd=1, relief="raised", padx=5, pady=2
+        width=25, command=load_calibration_and_apply, padx=5, pady=2
     )
     load_button.pack(side="left", padx=10)
 
     save_button = tk.Button(
         button_inner_frame, text="Save Current Calibration to CSV",
-        width=30, command=save_calibration_to_file, 
-        bg=COLOR_BUTTON_BG, fg=COLOR_TEXT_LIGHT,
-        activebackground=COLOR_BUTTON_ACTIVE,
-        activeforeground=COLOR_TEXT_LIGHT, bd=1, relief="raised", padx=5, pady=2
+        width=30, command=save_calibration_to_file, padx=5, pady=2
     )
     save_button.pack(side="left", padx=10)
 
     ctrl_status_frame = tk.Frame(root, bg=COLOR_BG_DARK)
     ctrl_status_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
     controller_status_label = tk.Label(
-        ctrl_status_frame, text="Connected Controller:\nNone", anchor="center", justify="center",
+        ctrl_status_frame, text="Connected Controller:\nNone",
         bg=COLOR_BG_DARK, fg=COLOR_TEXT_LIGHT, font=("Arial", 10)
     )
     controller_status_label.pack(padx=5, pady=5, expand=True)
 
     main_content_frame = tk.Frame(root, bg=COLOR_BG_DARK)
     main_content_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=5)
-    main_content_frame.grid_columnconfigure(0, weight=1, minsize=280) 
-    main_content_frame.grid_columnconfigure(1, weight=2, minsize=300) 
-    main_content_frame.grid_columnconfigure(2, weight=2, minsize=250) 
+    panel_min_widths = (280, 300, 250) # instructions, analog, terminal
+    panel_height = 500 # Requested height, the row still stretches with the window
+    for column, (weight, min_width) in enumerate(zip((1, 2, 2), panel_min_widths)):
+        main_content_frame.grid_columnconfigure(column, weight=weight, minsize=min_width)
     main_content_frame.grid_rowconfigure(0, weight=1)
 
-    instructions_frame = tk.Frame(main_content_frame, bd=1, relief="sunken", bg=COLOR_FRAME_DARK)
+    # The panels' children are packed, so pack_propagate(False) plus a fixed requested size keeps the
+    # Text/Canvas natural sizes from feeding back into the main grid on every resize
+    instructions_frame = tk.Frame(main_content_frame, bd=1, relief="sunken", bg=COLOR_FRAME_DARK,
+                                  width=panel_min_widths[0], height=panel_height)
     instructions_frame.grid(row=0, column=0, sticky="nsew", padx=(0,5), pady=5)
-    instructions_frame.grid_propagate(False)
+    instructions_frame.pack_propagate(False)
     instructions_text_widget = tk.Text(
         instructions_frame, wrap="word", bg=COLOR_FRAME_DARK, fg=COLOR_TEXT_LIGHT,
-        font=("Arial", 9), relief="flat", bd=0, highlightthickness=0, padx=5, pady=5
-    )
-    instructions_text_widget.insert(tk.END,
-        "Instructions:\n"
-        "Ensure your controller (DualSense/Edge) is calibrated via external tools first if needed (e.g., Steam Big Picture, DS4Windows, or online gamepad testers for basic checks).\n\n"
-        "1. 'Save Current Calibration to CSV': Reads the current stick calibration values from the connected USB controller and saves them to a CSV file.\n"
-        "2. 'Load Calibration from CSV': Loads calibration data from a previously saved CSV file and writes it to the connected USB controller.\n"
-        "3. Center panel: Visualizes analog stick and trigger movements.\n"
-        "4. Right panel: Logs application activity and errors.\n"
-        "5. Compatibility: Primarily for Sony DualSense / DualSense Edge controllers over USB for writing calibration. Reading may work for other devices shown by Pygame.\n"
-        "6. Settings: Configure 'Autoload on Windows Start', 'Start Minimized', and 'Load Calibration on Startup' using the checkboxes and file path below.\n"
-        "7. Startup File: Specify the CSV file to automatically load and apply if 'Load Calibration on Startup' is checked."
+        font=("Arial", 9), bd=0, highlightthickness=0, padx=5, pady=5,
+        undo=False # Read-only panel, no undo stack (the option database could otherwise enable it)
     )
+    instructions_text_widget.insert(tk.END, INSTRUCTIONS_TEXT)
     instructions_text_widget.config(state="disabled") 
     instructions_text_widget.pack(fill="both", expand=True, padx=5, pady=5)
 
-    analog_frame = tk.Frame(main_content_frame, bd=1, relief="sunken", bg=COLOR_FRAME_DARK)
+    analog_frame = tk.Frame(main_content_frame, bd=1, relief="sunken", bg=COLOR_FRAME_DARK,
+                            width=panel_min_widths[1], height=panel_height)
     analog_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-    analog_frame.grid_propagate(False)
+    analog_frame.pack_propagate(False)
     analog_canvas = tk.Canvas(analog_frame, bg=COLOR_CANVAS_BG, highlightthickness=0)
     analog_canvas.pack(fill="both", expand=True, padx=5, pady=5)
+    analog_canvas.bind("<Configure>", on_analog_canvas_configure)
 
-    terminal_frame = tk.Frame(main_content_frame, bd=1, relief="sunken", bg=COLOR_FRAME_DARK)
+    terminal_frame = tk.Frame(main_content_frame, bd=1, relief="sunken", bg=COLOR_FRAME_DARK,
+                              width=panel_min_widths[2], height=panel_height)
     terminal_frame.grid(row=0, column=2, sticky="nsew", padx=(5,0), pady=5)
-    terminal_frame.grid_propagate(False)
+    terminal_frame.pack_propagate(False)
     terminal_text = tk.Text(
-        terminal_frame, bg="#1E1E1E", fg=COLOR_TEXT_LIGHT, insertbackground=COLOR_TEXT_LIGHT,
+        terminal_frame, bg=COLOR_TERMINAL_BG, fg=COLOR_TEXT_LIGHT, insertbackground=COLOR_TEXT_LIGHT,
         bd=0, highlightthickness=0, wrap="word", font=("Consolas", 9) 
     )
     terminal_text.pack(side="left", fill="both", expand=True, padx=5, pady=5)
@@ -992,14 +1312,11 @@ def main():
     # --- GUI Layout End, Signal GUI is Ready ---
     gui_ready_and_valid = True 
 
-    # Flush any early log messages now that the terminal is ready
+    # Flush any early log messages now that the terminal is ready, as one insert
     if early_log_messages:
-        for msg in early_log_messages:
-            if terminal_text and terminal_text.winfo_exists():
-                 terminal_text.insert(tk.END, msg + "\n")
-        if terminal_text and terminal_text.winfo_exists():
-            terminal_text.see(tk.END) 
+        _log_queue.extend(early_log_messages)
         early_log_messages.clear()
+        flush_log_queue()
 
     log_to_terminal("Application GUI initialized.") 
 
@@ -1010,55 +1327,35 @@ def main():
     bottom_frame.grid_columnconfigure(1, weight=1) 
     bottom_frame.grid_columnconfigure(2, weight=1) 
 
-    autoload_checkbox = tk.Checkbutton(
-        bottom_frame, text="Autoload on Windows Start", variable=autoload_checkbox_var,
-        command=on_autoload_checkbox_change, bg=COLOR_BG_DARK, fg=COLOR_TEXT_LIGHT,
-        activebackground=COLOR_BG_DARK, activeforeground=COLOR_TEXT_LIGHT, selectcolor=COLOR_CHECK_SELECT, anchor='w'
-    )
-    autoload_checkbox.grid(row=0, column=0, padx=5, pady=2, sticky='w')
-
-    start_minimized_checkbox = tk.Checkbutton(
-        bottom_frame, text="Start Minimized to Tray", variable=start_minimized_var,
-        command=on_start_minimized_checkbox_change, bg=COLOR_BG_DARK, fg=COLOR_TEXT_LIGHT,
-        activebackground=COLOR_BG_DARK, activeforeground=COLOR_TEXT_LIGHT, selectcolor=COLOR_CHECK_SELECT, anchor='w'
-    )
-    start_minimized_checkbox.grid(row=0, column=1, padx=5, pady=2, sticky='w')
-
-    autoload_calibration_checkbox = tk.Checkbutton(
-        bottom_frame, text="Load Calibration on App Startup", variable=autoload_calibration_var,
-        command=on_autoload_calibration_checkbox_change, bg=COLOR_BG_DARK, fg=COLOR_TEXT_LIGHT,
-        activebackground=COLOR_BG_DARK, activeforeground=COLOR_TEXT_LIGHT, selectcolor=COLOR_CHECK_SELECT, anchor='w'
-    )
-    autoload_calibration_checkbox.grid(row=0, column=2, padx=5, pady=2, sticky='w')
+    for column, (text, variable, command) in enumerate((
+        ("Autoload on Windows Start", autoload_checkbox_var, on_autoload_checkbox_change),
+        ("Start Minimized to Tray", start_minimized_var, on_start_minimized_checkbox_change),
+        ("Load Calibration on App Startup", autoload_calibration_var, on_autoload_calibration_checkbox_change),
+    )):
+        tk.Checkbutton(bottom_frame, text=text, variable=variable, command=command).grid(row=0, column=column, padx=5, pady=2, sticky='w')
 
     file_select_frame = tk.Frame(root, bg=COLOR_BG_DARK)
     file_select_frame.grid(row=4, column=0, sticky="ew", padx=10, pady=(2,10)) # Row 4
+    file_select_frame.grid_columnconfigure(1, weight=1) # Only the path entry stretches
     startup_file_label = tk.Label(file_select_frame, text="Startup Calibration File:", bg=COLOR_BG_DARK, fg=COLOR_TEXT_LIGHT)
-    startup_file_label.pack(side="left", padx=(0,5))
+    startup_file_label.grid(row=0, column=0, padx=(0,5))
     startup_file_entry = tk.Entry(
         file_select_frame, textvariable=startup_calibration_file_path_var, width=60, 
-        bg=COLOR_FRAME_DARK, fg=COLOR_TEXT_LIGHT, insertbackground=COLOR_TEXT_LIGHT, relief="sunken", bd=1
-    )
-    startup_file_entry.pack(side="left", padx=5, fill="x", expand=True)
-    browse_button = tk.Button(
-        file_select_frame, text="Browse...", command=on_browse_startup_file,
-        bg=COLOR_BUTTON_BG, fg=COLOR_TEXT_LIGHT, activebackground=COLOR_BUTTON_ACTIVE,
-        activeforeground=COLOR_TEXT_LIGHT, bd=1, relief="raised"
+        bg=COLOR_FRAME_DARK, fg=COLOR_TEXT_LIGHT, insertbackground=COLOR_TEXT_LIGHT, bd=1
     )
-    browse_button.pack(side="left", padx=5)
+    startup_file_entry.grid(row=0, column=1, padx=5, sticky="ew")
+    browse_button = tk.Button(file_select_frame, text="Browse...", command=on_browse_startup_file)
+    browse_button.grid(row=0, column=2, padx=5)
     
 
-    profiler = None
-    if PROFILING_ENABLED:
-        profiler = cProfile.Profile()
-        profiler.enable()
-        log_to_terminal("Profiling enabled.")
-
     start_joystick_thread() 
 
     if root and root.winfo_exists(): # Ensure root is valid before scheduling .after calls
-        root.after(500, update_controller_status_display) 
-        root.after(DRAW_INTERVAL_MS, draw_analog_sticks_on_canvas) 
+        # ui_tick drives the redraw and the status label from one timer
+        root.after(DRAW_INTERVAL_MS, ui_tick)
+        # No fixed startup delay: the autoload worker applies as soon as the joystick thread connects.
+        # after_idle, so the worker only starts once mainloop is dispatching
+        root.after_idle(auto_load_calibration_on_startup)
 
         if start_minimized_var.get():
             log_to_terminal("Starting minimized as per settings.")
@@ -1068,12 +1365,19 @@ def main():
             root.lift()
             root.focus_force()
             log_to_terminal("Application window shown.")
-        
-        root.after(2000, auto_load_calibration_on_startup) # Reduced initial delay (was 3000)
     else: # Should not happen if root is created properly
         print("[Error] Root window not valid before mainloop start.")
         return # Exit if root isn't there
 
+    # Only the Tk thread's mainloop is profiled; cProfile never instruments the joystick poll thread
+    profiler = None
+    if PROFILING_ENABLED:
+        import cProfile
+        # builtins/subcalls off: far less hook overhead, so the Tk callbacks aren't skewed by the profiler itself
+        profiler = cProfile.Profile(builtins=False, subcalls=False)
+        profiler.enable()
+        log_to_terminal("Profiling enabled.")
+
     try:
         root.mainloop()
     finally:
@@ -1083,19 +1387,19 @@ def main():
         if PROFILING_ENABLED and profiler: 
             profiler.disable() 
             log_to_terminal("Profiling disabled.") 
-            stats = pstats.Stats(profiler).sort_stats('cumulative') 
-            stats.print_stats(30) 
-            profile_file = "profile_output.prof" 
             try:
-                stats.dump_stats(profile_file) 
-                log_to_terminal(f"Profiling stats saved to {profile_file}") 
+                profiler.dump_stats(PROFILE_OUTPUT_FILE) # Binary pstats, e.g. for snakeviz
+                log_to_terminal(f"Profiling stats saved to {PROFILE_OUTPUT_FILE}") 
             except Exception as e:
                 log_to_terminal(f"Error saving profile stats: {e}") 
+            import pstats
+            stats = pstats.Stats(profiler).strip_dirs().sort_stats('tottime') # 'cumulative' is dominated by mainloop
+            stats.print_stats(30) 
         
-        joystick_thread_running = False 
+        joystick_stop_event.set()
         if joystick_thread and joystick_thread.is_alive(): 
              log_to_terminal("Ensuring joystick thread shutdown from main finally block...") 
-             joystick_thread.join(timeout=0.5) 
+             joystick_thread.join(timeout=0.2) 
         log_to_terminal("Ensuring HID devices closed from main finally block...") 
         utils_hid.close_all_hid_devices() 
 
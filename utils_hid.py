@@ -1,51 +1,105 @@
 import hid
+import logging
 import time
+import threading
+from functools import wraps
+
+# Lazy %-formatting: messages below the configured level cost only a level check
+log = logging.getLogger(__name__)
+
+# Bound once instead of a module attribute lookup per call. cython-hidapi (the "hidapi" package)
+# has no HIDException and raises OSError/IOError, so fall back to that.
+_HidDevice = hid.device
+_HIDException = getattr(hid, "HIDException", OSError)
+
+DEAD_DEVICE_TTL = 0.5 # Seconds open_hid_device() refuses a path whose handle failed and could not be reopened
 
 # Dictionary to store opened device handles {dev_path: device_object}
 _open_devices = {}
-
+_dead_until = {} # {dev_path: time.monotonic() before which open_hid_device() won't retry it}, see _recover_device()
+# hidapi handles are not thread-safe (the joystick thread reads input reports while the GUI thread
+# sends feature reports), so every open/close/I/O on a path runs under that path's lock
+_device_locks = {} # {dev_path: threading.RLock()}, reentrant because I/O errors call close_hid_device()
+_device_locks_guard = threading.Lock() # Only guards creating entries in _device_locks
+
+def _get_device_lock(dev_path):
+    lock = _device_locks.get(dev_path)
+    if lock is None:
+        with _device_locks_guard:
+            lock = _device_locks.setdefault(dev_path, threading.RLock())
+    return lock
+
+def _serialized_per_device(func):
+    """Runs func(dev_path, ...) while holding dev_path's lock."""
+    @wraps(func)
+    def wrapper(dev_path, *args, **kwargs):
+        with _get_device_lock(dev_path):
+            return func(dev_path, *args, **kwargs)
+    return wrapper
+
+
+@_serialized_per_device
 def open_hid_device(dev_path):
     """
     Opens a HID device if not already open and caches the handle.
     Returns the device handle or None if opening fails.
     """
-    if dev_path in _open_devices and _open_devices[dev_path]:
+    device = _open_devices.get(dev_path) # One lookup on the hot path of every HID call
+    if device:
         # Optionally, add a check here to see if the cached device is still valid
         # For now, assume it is if it's in the dictionary.
-        return _open_devices[dev_path]
+        return device
+    dead_until = _dead_until.get(dev_path)
+    if dead_until is not None and time.monotonic() < dead_until:
+        return None # Recently failed and could not be reopened, don't hammer open_path()
     try:
-        device = hid.device()
+        device = _HidDevice()
         device.open_path(dev_path)
         device.set_nonblocking(1)  # Set non-blocking once after opening
         _open_devices[dev_path] = device
-        print(f"[HID] Device opened and cached: {dev_path}")
+        _dead_until.pop(dev_path, None) # The path works now
+        log.info("Device opened and cached: %s", dev_path)
         return device
     except Exception as e:
-        print(f"[HID ERROR] Error opening device {dev_path}: {e}")
-        if dev_path in _open_devices: # Clean up if entry exists but is invalid
-            del _open_devices[dev_path]
+        log.error("Error opening device %s: %s", dev_path, e)
+        _open_devices.pop(dev_path, None) # Clean up if entry exists but is invalid
         return None
 
+@_serialized_per_device
 def close_hid_device(dev_path):
     """Closes a specific HID device and removes it from the cache."""
-    if dev_path in _open_devices and _open_devices[dev_path]:
+    device = _open_devices.pop(dev_path, None)
+    if device:
         try:
-            _open_devices[dev_path].close()
-            print(f"[HID] Device closed: {dev_path}")
+            device.close()
+            log.info("Device closed: %s", dev_path)
         except Exception as e:
-            print(f"[HID ERROR] Error closing device {dev_path}: {e}")
-        del _open_devices[dev_path]
-    elif dev_path not in _open_devices:
-        print(f"[HID WARNING] Device path not found in cache for closing: {dev_path}")
+            log.error("Error closing device %s: %s", dev_path, e)
+    else: # Already closed, e.g. by _recover_device() before the caller noticed the disconnect
+        log.debug("Device path not found in cache for closing: %s", dev_path)
 
 
+def _recover_device(dev_path):
+    """
+    Called after a hidapi error on a cached handle: closes it and reopens once. A path that
+    cannot be reopened (e.g. unplugged) is marked dead for DEAD_DEVICE_TTL, so the following
+    calls fail fast instead of each retrying open_path(). Returns the new handle or None.
+    """
+    close_hid_device(dev_path)
+    device = open_hid_device(dev_path)
+    if device is None:
+        log.info("Device %s seems disconnected. Not retrying it for %ss.", dev_path, DEAD_DEVICE_TTL)
+        _dead_until[dev_path] = time.monotonic() + DEAD_DEVICE_TTL
+    return device
+
 def close_all_hid_devices():
     """Closes all cached HID devices."""
-    print("[HID] Closing all cached devices...")
+    log.info("Closing all cached devices...")
     paths_to_close = list(_open_devices.keys())
     for path in paths_to_close:
         close_hid_device(path)
 
+@_serialized_per_device
 def hid_get_feature_report(dev_path, report_id, size):
     if not isinstance(size, int):
         raise ValueError("Size must be an integer.")
@@ -54,7 +108,7 @@ def hid_get_feature_report(dev_path, report_id, size):
 
     device = open_hid_device(dev_path)
     if not device:
-        print(f"[HID ERROR] Get Feature Report: Device not open or accessible: {dev_path}")
+        log.error("Get Feature Report: Device not open or accessible: %s", dev_path)
         return None
 
     try:
@@ -66,150 +120,125 @@ def hid_get_feature_report(dev_path, report_id, size):
         if not response:
             # Non-blocking read might return None if no data immediately available.
             # Depending on protocol, this might be normal or an error.
-            # print(f"[HID WARNING] Get Feature Report: No data received for report ID {report_id}.")
             return None # Or handle as appropriate for your device's protocol
 
-        if response[0] != report_id:
-            # This check might be too strict if the device can return other reports
-            # on the feature report endpoint, or if report_id is not always the first byte.
-            # print(f"[HID WARNING] Get Feature Report: Invalid report ID. Expected {report_id}, got {response[0]}. Data: {response}")
-            # For some devices, the actual report data might follow, so consider returning response if it looks valid otherwise.
-            pass # Assuming for now that the first byte should match. If not, this check needs adjustment.
-
-        return response
-    except hid.HIDException as e: # hid.HIDException is more specific
-        print(f"[HID ERROR] Get Feature Report for {dev_path}, report ID {report_id}: {e}")
-        if "No such device" in str(e) or "failed to read" in str(e).lower(): # Device likely disconnected
-            print(f"[HID] Device {dev_path} seems disconnected. Closing handle.")
-            close_hid_device(dev_path)
+        # Report ID validation is left to the callers, which know their protocol (e.g. get_controller_serial)
+        # cython-hidapi hands back a list of ints; one bytes() copy lets callers slice without further copies
+        return bytes(response)
+    except _HIDException as e: # hidapi I/O error, see _HIDException
+        log.error("Get Feature Report for %s, report ID %s: %s", dev_path, report_id, e)
+        _recover_device(dev_path)
         return None
     except Exception as e:
-        print(f"[HID ERROR] Get Feature Report (Unknown) for {dev_path}, report ID {report_id}: {e}")
+        log.error("Get Feature Report (Unknown) for %s, report ID %s: %s", dev_path, report_id, e)
         return None
 
+def build_report(report_id, data):
+    """
+    Returns report_id followed by data as one bytearray: a single allocation and copy
+    instead of building intermediate lists/bytes. data may be bytes-like or a list of ints.
+    """
+    report = bytearray(len(data) + 1)
+    report[0] = report_id
+    report[1:] = data
+    return report
+
+@_serialized_per_device
 def hid_set_feature_report(dev_path, report_id, data):
     device = open_hid_device(dev_path)
     if not device:
-        print(f"[HID ERROR] Set Feature Report: Device not open or accessible: {dev_path}")
+        log.error("Set Feature Report: Device not open or accessible: %s", dev_path)
         return False # Indicate failure
 
     try:
         # Removed time.sleep(0.2)
-        report = [report_id] + list(data)
-        result = device.send_feature_report(report)
+        result = device.send_feature_report(build_report(report_id, data))
 
         if result < 0: # Typically indicates an error by the underlying system call
-            print(f"[HID ERROR] Set Feature Report: send_feature_report failed for {dev_path}, report ID {report_id}. Result: {result}")
+            log.error("Set Feature Report: send_feature_report failed for %s, report ID %s. Result: %s", dev_path, report_id, result)
             # Consider device state; an error here might mean it's disconnected.
             return False
         else:
-            # print(f"[HID] Set Feature Report sent successfully to {dev_path}, report ID {report_id}.")
+            log.debug("Set Feature Report sent successfully to %s, report ID %s.", dev_path, report_id)
             return True # Indicate success
 
-    except hid.HIDException as e:
-        print(f"[HID ERROR] Set Feature Report for {dev_path}, report ID {report_id}: {e}")
-        if "No such device" in str(e) or "failed to write" in str(e).lower():
-            print(f"[HID] Device {dev_path} seems disconnected during set. Closing handle.")
-            close_hid_device(dev_path)
+    except _HIDException as e:
+        log.error("Set Feature Report for %s, report ID %s: %s", dev_path, report_id, e)
+        _recover_device(dev_path)
         return False
     except Exception as e:
-        print(f"[HID ERROR] Set Feature Report (Unknown) for {dev_path}, report ID {report_id}: {e}")
+        log.error("Set Feature Report (Unknown) for %s, report ID %s: %s", dev_path, report_id, e)
         return False
 
+@_serialized_per_device
 def hid_get_input_report(dev_path, size):
     # This function might need careful handling of non-blocking reads,
     # as input reports are often asynchronous.
     device = open_hid_device(dev_path)
     if not device:
-        print(f"[HID ERROR] Get Input Report: Device not open or accessible: {dev_path}")
+        log.error("Get Input Report: Device not open or accessible: %s", dev_path)
         return None
     try:
         # Removed time.sleep(0.2)
         # For input reports, a timeout on read might be more appropriate than a sleep before.
         # response = device.read(size, timeout_ms=10) # Example with timeout if your hid library version supports it
         response = device.read(size) # Standard read
-        # if not response:
-            # print(f"[HID WARNING] Get Input Report: No input report received from {dev_path}.")
         return response
-    except hid.HIDException as e:
-        print(f"[HID ERROR] Get Input Report for {dev_path}: {e}")
-        if "No such device" in str(e):
+    except _HIDException as e:
+        log.error("Get Input Report for %s: %s", dev_path, e)
+        device = _recover_device(dev_path)
+        if device is None:
+            return None
+        # Retry once on the reopened handle; returning None here would make the caller
+        # treat the device as disconnected and throw the fresh handle away
+        try:
+            return device.read(size)
+        except Exception as e:
+            log.error("Get Input Report retry for %s: %s", dev_path, e)
             close_hid_device(dev_path)
-        return None
+            return None
     except Exception as e:
-        print(f"[HID ERROR] Get Input Report (Unknown) for {dev_path}: {e}")
+        log.error("Get Input Report (Unknown) for %s: %s", dev_path, e)
         return None
 
-
+@_serialized_per_device
+def hid_get_latest_input_report(dev_path, size, max_reports=64):
+    """
+    Drains the queued input reports of a non-blocking device and returns only the newest one.
+    Devices that report faster than they are polled would otherwise be read with ever-growing lag.
+    Returns [] if nothing was queued, or None on a read error (same convention as hid_get_input_report).
+    """
+    latest = []
+    for _ in range(max_reports):
+        report = hid_get_input_report(dev_path, size)
+        if report is None:
+            return None
+        if not report:
+            break
+        latest = report
+    return latest
+
+
+@_serialized_per_device
 def hid_set_output_report(dev_path, report_id, data):
     device = open_hid_device(dev_path)
     if not device:
-        print(f"[HID ERROR] Set Output Report: Device not open or accessible: {dev_path}")
+        log.error("Set Output Report: Device not open or accessible: %s", dev_path)
         return False
 
     try:
         # Removed time.sleep(0.2)
-        report = bytes([report_id] + list(data)) # Ensure it's bytes for write
-        result = device.write(report) # device.write usually expects bytes
+        result = device.write(build_report(report_id, data))
 
         if result < 0:
-            print(f"[HID ERROR] Set Output Report: device.write failed for {dev_path}. Result: {result}")
+            log.error("Set Output Report: device.write failed for %s. Result: %s", dev_path, result)
             return False
-        # print(f"[HID] Output report sent successfully to {dev_path}.")
+        log.debug("Output report sent successfully to %s.", dev_path)
         return True
-    except hid.HIDException as e:
-        print(f"[HID ERROR] Set Output Report for {dev_path}: {e}")
-        if "No such device" in str(e):
-            close_hid_device(dev_path)
-        return False
-    except Exception as e:
-        print(f"[HID ERROR] Set Output Report (Unknown) for {dev_path}: {e}")
-        return False
-
-def is_device_responsive(dev_path, tries=2, delay=0.01):
-    """
-    Checks if a device is responsive by attempting a small read.
-    Uses cached device if available, otherwise opens temporarily.
-    """
-    device = _open_devices.get(dev_path)
-    opened_temporarily = False
-
-    if not device:
-        try:
-            # print(f"[HID is_device_responsive] Temporarily opening {dev_path} for check.")
-            device = hid.device()
-            device.open_path(dev_path)
-            device.set_nonblocking(True)
-            opened_temporarily = True
-        except Exception as e:
-            # print(f"[HID is_device_responsive] Exception opening device {dev_path}: {e}")
-            return False
-    if not device: # Still no device
-        return False
-
-    try:
-        for _ in range(tries):
-            # Attempt to read a small amount of data (e.g., 1 byte, or a typical report size like 64)
-            # The read itself might be blocking or non-blocking based on device.set_nonblocking()
-            data = device.read(64) # Read up to 64 bytes
-            if data: # Any data received means it's responsive
-                # print(f"[HID is_device_responsive] Device {dev_path} responded.")
-                return True
-            time.sleep(delay) # Wait a bit before retrying
-        # print(f"[HID is_device_responsive] Device {dev_path} did not respond after {tries} tries.")
-        return False
-    except hid.HIDException as e: # Catch HID specific errors
-        # print(f"[HID is_device_responsive] HIDException for {dev_path}: {e}")
-        if "No such device" in str(e) and not opened_temporarily : # If it was a cached device and now it's gone
-             close_hid_device(dev_path) # Remove bad handle from cache
+    except _HIDException as e:
+        log.error("Set Output Report for %s: %s", dev_path, e)
+        _recover_device(dev_path)
         return False
     except Exception as e:
-        # print(f"[HID is_device_responsive] Generic exception for {dev_path}: {e}")
+        log.error("Set Output Report (Unknown) for %s: %s", dev_path, e)
         return False
-    finally:
-        if opened_temporarily and device:
-            try:
-                device.close()
-                # print(f"[HID is_device_responsive] Temporarily opened device {dev_path} closed.")
-            except Exception as e:
-                print(f"[HID ERROR] is_device_responsive: Error closing temp device {dev_path}: {e}")